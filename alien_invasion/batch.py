@@ -0,0 +1,250 @@
+import json
+import os
+import sys
+import time
+import traceback
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from functools import partial
+from itertools import product
+from pathlib import Path
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, Self
+
+import pygame
+from pygame.event import Event
+
+from game import rng
+from game.gf import common, events
+from game.hud import Hud
+from game.screen import Screen
+from game.settings import Settings
+from game.ship import Ship
+from game.sprites import Sprites
+from game.stages import Stages
+from game.stats import Stats
+from run import initialize, simulate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from game.stages import StageTypes
+
+
+class Result(StrEnum):
+    CLEARED = "cleared"
+    DIED = "died"
+    QUIT = "quit"
+    TIMEOUT = "timeout"
+    CRASHED = "crashed"
+
+
+@dataclass(frozen=True)
+class Job:
+    stage: str
+    seed: int
+    steps: int
+    health: int | None = None
+    playback_events: str | None = None
+
+
+@dataclass
+class Outcome:
+    stage: str
+    seed: int
+    result: Result
+    steps: int
+    game_time: float
+    seconds: float
+    ships_left: int
+    error: str | None = None
+
+
+class Autopilot:
+    """Scripted player: holds random direction for a while, keeps firing and sometimes uses shield."""
+
+    DIRECTIONS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+    def __init__(self, hold_steps: int = 120, fire_steps: int = 30, shield_steps: int = 1000) -> None:
+        self.hold_steps = hold_steps
+        self.fire_steps = fire_steps
+        self.shield_steps = shield_steps
+        self.direction: int | None = None
+        self.step = 0
+
+    def next_events(self) -> list[Event]:
+        frame = []
+        if not self.step % self.hold_steps:
+            if self.direction is not None:
+                frame.append(Event(pygame.KEYUP, key=self.direction))
+            self.direction = rng.choice(self.DIRECTIONS)
+            frame.append(Event(pygame.KEYDOWN, key=self.direction))
+        if not self.step % self.fire_steps:
+            frame.append(Event(pygame.KEYDOWN, key=pygame.K_a))
+        if self.step % self.shield_steps == self.shield_steps // 2:
+            frame.append(Event(pygame.KEYDOWN, key=pygame.K_d))
+        self.step += 1
+        return frame
+
+
+@dataclass
+class Session:
+    settings: Settings
+    screen: Screen
+    stats: Stats
+    ship: Ship
+    sprites: Sprites
+    hud: Hud
+    stages: Stages
+
+    @classmethod
+    def create(cls, health: int | None) -> Self:
+        settings = Settings(health=health)
+        screen = Screen(settings.screen_width, settings.screen_height, headless=True)
+        stats = Stats(settings)
+        ship = Ship(settings, screen)
+        sprites = Sprites()
+        hud = Hud(settings=settings, screen=screen, stats=stats, ship=ship, sprites=sprites)
+        stages = Stages(settings=settings, screen=screen, stats=stats, hud=hud, ship=ship, sprites=sprites)
+        return cls(settings=settings, screen=screen, stats=stats, ship=ship, sprites=sprites, hud=hud, stages=stages)
+
+    def step(self, dt: float) -> bool:
+        # Same as one iteration of active game loop in headless mode.
+        active_events = events.check_active_game_events(settings=self.settings,
+                                                        screen=self.screen,
+                                                        stats=self.stats,
+                                                        hud=self.hud,
+                                                        ship=self.ship,
+                                                        sprites=self.sprites)
+        if active_events.quit:
+            return False
+
+        common.handle_ship_diagonal_movement(self.ship)
+        return simulate(settings=self.settings,
+                        screen=self.screen,
+                        stats=self.stats,
+                        ship=self.ship,
+                        sprites=self.sprites,
+                        stages=self.stages,
+                        dt=dt)
+
+
+def advance(session: Session, stage: StageTypes, autopilot: Autopilot | None, dt: float) -> Result | None:
+    # One step of a run, result is returned when the run is over.
+    if autopilot:
+        events.Events().feed(autopilot.next_events())
+    if not session.step(dt):
+        if session.stats.ships_left < 1:
+            return Result.DIED
+        # Game ends without quit event only when the last stage is cleared.
+        if stage == session.stages.last and not (session.sprites.aliens or session.sprites.bosses):
+            return Result.CLEARED
+        return Result.QUIT
+    if session.stages.current != stage:
+        return Result.CLEARED
+    return None
+
+
+def play(job: Job) -> Outcome:
+    # Play one stage headless until it is cleared, ship is destroyed or steps are over.
+    rng.seed(job.seed)
+    events.Events().clear()
+    autopilot = None
+    if job.playback_events:
+        events.Events().load(job.playback_events)
+    else:
+        autopilot = Autopilot()
+
+    session = Session.create(health=job.health)
+    common.initialize_game_from_main_menu(stats=session.stats,
+                                          hud=session.hud,
+                                          ship=session.ship)
+    session.stages.select(job.stage)
+    stage = session.stages.current
+    dt = 1000 / session.settings.simulation_rate
+
+    result, error, steps = None, None, 0
+    start = time.perf_counter()
+    while result is None and steps < job.steps:
+        steps += 1
+        try:
+            result = advance(session=session, stage=stage, autopilot=autopilot, dt=dt)
+        except Exception:  # ruff:ignore[blind-except]
+            result, error = Result.CRASHED, traceback.format_exc()
+
+    return Outcome(stage=job.stage,
+                   seed=job.seed,
+                   result=result or Result.TIMEOUT,
+                   steps=steps,
+                   game_time=steps * dt,
+                   seconds=time.perf_counter() - start,
+                   ships_left=session.stats.ships_left,
+                   error=error)
+
+
+def summarize(outcomes: Iterable[Outcome]) -> dict[str, dict[str, Any]]:
+    by_stage: defaultdict[str, list[Outcome]] = defaultdict(list)
+    for outcome in outcomes:
+        by_stage[outcome.stage].append(outcome)
+
+    summary = {}
+    for stage, runs in by_stage.items():
+        results = Counter(run.result for run in runs)
+        summary[stage] = {
+            "runs": len(runs),
+            **{result.value: results[result] for result in Result},
+            "mean_game_time": fmean(run.game_time for run in runs),
+            "mean_seconds": fmean(run.seconds for run in runs),
+        }
+    return summary
+
+
+def run_batch(jobs: list[Job], workers: int | None) -> dict[str, Any]:
+    # Play jobs in process pool and merge outcomes into one report.
+    workers = workers or os.cpu_count() or 1
+    # Few chunks per worker keep all cores busy and still amortize IPC.
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=partial(initialize, headless=True)) as executor:
+        outcomes = list(executor.map(play, jobs, chunksize=chunksize))
+
+    return {
+        "workers": workers,
+        "jobs": len(jobs),
+        "seconds": time.perf_counter() - start,
+        "stages": summarize(outcomes),
+        "runs": [asdict(outcome) for outcome in outcomes],
+    }
+
+
+def stage_names() -> list[str]:
+    initialize(headless=True)
+    return [stage.name for stage in Session.create(health=None).stages]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Play stages headless in parallel and report outcomes")
+    parser.add_argument("--stage", type=str, action="append", help="Stage to play, all stages by default")
+    parser.add_argument("--seeds", type=int, default=10, help="Runs per stage, seeded from 0")
+    parser.add_argument("--steps", type=int, default=60 * 240, help="Maximum simulation steps per run")
+    parser.add_argument("--health", type=int)
+    parser.add_argument("--playback-events", type=str)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--report", type=Path, default=Path("batch_report.json"))
+    args = parser.parse_args()
+
+    jobs = [
+        Job(stage=stage, seed=seed, steps=args.steps, health=args.health, playback_events=args.playback_events)
+        for stage, seed in product(args.stage or stage_names(), range(args.seeds))
+    ]
+    report = run_batch(jobs, workers=args.workers)
+    args.report.write_text(json.dumps(report, indent=4), encoding="utf-8")
+
+    for stage, summary in report["stages"].items():
+        counts = ", ".join(f"{result}={summary[result]}" for result in Result)
+        sys.stdout.write(f"{stage}: {counts}, mean {summary['mean_seconds']:.2f}s\n")
+    sys.stdout.write(f"{report['jobs']} runs on {report['workers']} workers in {report['seconds']:.2f}s\n")
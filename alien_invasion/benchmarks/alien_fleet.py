@@ -0,0 +1,73 @@
+"""Per-step cost of merging colliding aliens: spritecollide per alien against sort and sweep over fleet.
+
+Run from alien_invasion directory: python -m benchmarks.alien_fleet
+
+"""
+import random
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+import pygame
+from pygame.rect import Rect
+from pygame.sprite import Group, Sprite
+
+from game.alien import merge_fleet
+from game.settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+REPEAT = 20
+FLEET_SIZES = (10, 50, 100, 200, 500)
+
+
+class FleetAlien(Sprite):
+
+    def __init__(self, rect: Rect) -> None:
+        super().__init__()
+        self.rect: Rect = rect
+
+
+def collidable(alien: FleetAlien, other: FleetAlien) -> bool:
+    return alien is not other and alien.rect.colliderect(other.rect)
+
+
+def legacy_merge_fleet(aliens: Group) -> None:
+    # Implementation before fleet sweep: every alien tested against whole group in Alien.update.
+    for alien in aliens.sprites():
+        for other in pygame.sprite.spritecollide(alien, aliens, dokill=False, collided=collidable):
+            aliens.remove(other)
+
+
+def create_fleet(size: int, settings: Settings) -> list[FleetAlien]:
+    # Fleet spread over the screen, scaled so that only a few aliens touch each other.
+    generator = random.Random(size)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+    scale = max(1, size // 20)
+    return [
+        FleetAlien(Rect(generator.randrange(settings.screen_width * scale),
+                        generator.randrange(settings.screen_height),
+                        60,
+                        58))
+        for _ in range(size)
+    ]
+
+
+def measure(merge: Callable[[Group], None], fleet: list[FleetAlien]) -> float:
+    # Best time of one merge pass, group is recreated because merge removes aliens.
+    return min(timeit.repeat(lambda: merge(Group(fleet)), number=REPEAT, repeat=5)) / REPEAT
+
+
+def main() -> None:
+    settings = Settings(health=None)
+    sys.stdout.write(f"best of 5 x {REPEAT}\n")
+    for size in FLEET_SIZES:
+        fleet = create_fleet(size, settings)
+        row = [f"{size:>5} aliens"]
+        for name, merge in (("spritecollide", legacy_merge_fleet), ("sweep", merge_fleet)):
+            row.append(f"{name}: {measure(merge, fleet) * 1e6:10.1f} us")
+        sys.stdout.write(", ".join(row) + "\n")
+
+
+if __name__ == "__main__":
+    main()
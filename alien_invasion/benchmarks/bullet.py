@@ -0,0 +1,112 @@
+"""Size and update cost of ship bullet: position for every ship rotation against position and velocity from table.
+
+Run from alien_invasion directory: python -m benchmarks.bullet
+
+"""
+import sys
+import timeit
+import tracemalloc
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pygame.sprite import Group, Sprite
+
+from game.bullet import Bullet
+from game.screen import Screen, ScreenSide
+from game.settings import Settings
+from game.ship import Ship
+from run import initialize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pygame.rect import Rect
+
+REPEAT = 200
+BULLETS = 200
+
+
+class LegacyBullet(Sprite):
+    # Implementation before direction table: position kept for all eight rotations, rotation matched on update.
+
+    def __init__(self, settings: Settings, screen: Screen, ship: Ship) -> None:
+        super().__init__()
+        self.screen = screen
+        self.image = Bullet.IMAGE
+        self.rect: Rect = self.image.get_rect(center=ship.rect.center)
+        x, y = float(self.rect.centerx), float(self.rect.centery)
+        self.y_up, self.x_up = y - 35, x
+        self.y_right, self.x_right = y + 5, x + 30
+        self.y_left, self.x_left = y + 5, x - 45
+        self.y_down, self.x_down = y + 35, x - 1
+        self.y_up_right, self.x_up_right = y - 27, x + 24
+        self.y_up_left, self.x_up_left = y - 30, x - 30
+        self.y_down_left, self.x_down_left = y + 30, x - 33
+        self.y_down_right, self.x_down_right = y + 32, x + 27
+        self.speed_factor = settings.bullet_speed_factor
+        self.bullet_rotation = ship.current_ship_rotation
+
+    def update(self, dt: float) -> None:
+        distance = self.speed_factor * dt
+        match self.bullet_rotation:
+            case ScreenSide.TOP:
+                self.y_up -= distance
+                self.rect.centery, self.rect.centerx = self.y_up, self.x_up  # type: ignore[assignment]
+            case ScreenSide.RIGHT:
+                self.x_right += distance
+                self.rect.centerx, self.rect.centery = self.x_right, self.y_right  # type: ignore[assignment]
+            case ScreenSide.LEFT:
+                self.x_left -= distance
+                self.rect.centerx, self.rect.centery = self.x_left, self.y_left  # type: ignore[assignment]
+            case ScreenSide.BOTTOM:
+                self.y_down += distance
+                self.rect.centery, self.rect.centerx = self.y_down, self.x_down  # type: ignore[assignment]
+            case ScreenSide.TOP_RIGHT:
+                self.y_up_right -= distance
+                self.x_up_right += distance
+                self.rect.centery, self.rect.centerx = self.y_up_right, self.x_up_right  # type: ignore[assignment]
+            case ScreenSide.TOP_LEFT:
+                self.y_up_left -= distance
+                self.x_up_left -= distance
+                self.rect.centery, self.rect.centerx = self.y_up_left, self.x_up_left  # type: ignore[assignment]
+            case ScreenSide.BOTTOM_LEFT:
+                self.y_down_left += distance
+                self.x_down_left -= distance
+                self.rect.centery, self.rect.centerx = self.y_down_left, self.x_down_left  # type: ignore[assignment]
+            case ScreenSide.BOTTOM_RIGHT:
+                self.y_down_right += distance
+                self.x_down_right += distance
+                self.rect.centery, self.rect.centerx = self.y_down_right, self.x_down_right  # type: ignore[assignment]
+
+
+def size(create: Callable[[], Sprite]) -> float:
+    # Bytes allocated per bullet, including its rect and attributes of Sprite.
+    create()
+    tracemalloc.start()
+    bullets = [create() for _ in range(BULLETS)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(bullets)
+
+
+def main() -> None:
+    initialize(headless=True)
+    settings = Settings(health=None)
+    screen = Screen(settings.screen_width, settings.screen_height, headless=True)
+    ship = Ship(settings, screen)
+    # Bottom right is the last case of rotation match.
+    ship.current_ship_rotation = ScreenSide.BOTTOM_RIGHT
+    dt = 1000 / settings.simulation_rate
+
+    sys.stdout.write(f"{BULLETS} bullets, best of 5 x {REPEAT}\n")
+    for name, cls in (("legacy", LegacyBullet), ("table", Bullet)):
+        create: Callable[[], Sprite] = partial(cls, settings, screen, ship)
+        bullets = Group([create() for _ in range(BULLETS)])
+        created = min(timeit.repeat(create, number=REPEAT, repeat=5)) / REPEAT
+        updated = min(timeit.repeat(partial(bullets.update, dt), number=REPEAT, repeat=5)) / REPEAT
+        sys.stdout.write(f"{name:>8}: {size(create):6.0f} bytes, "
+                         f"create {created * 1e6:6.2f} us, update of all {updated * 1e6:8.1f} us\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Per-volley cost of bullet direction: csv read per bullet, cached table with bisect and atan2.
+
+Run from alien_invasion directory: python -m benchmarks.find_angle
+
+"""
+import csv
+import math
+import sys
+import timeit
+from pathlib import Path
+
+from game import find_angle as fa
+from game.paths import Paths
+from game.settings import Settings
+
+REPEAT = 200
+
+
+def legacy_find_angle(filepath: Path, value: float) -> float:
+    # Implementation before tables were cached: read, parse and sort on every call.
+    data = {}
+    with Path.open(filepath, encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=";")
+        for row in reader:
+            data[float(row[1])] = int(row[0])
+    for x in sorted(data.keys()):
+        if x > value:
+            break
+    return data[x]
+
+
+def main() -> None:
+    settings = Settings(health=None)
+    alien_width = 60
+    volley = int((settings.screen_width - 2 * alien_width) / (2 * alien_width))
+    ship = (settings.screen_width / 2, settings.screen_height / 2)
+    bullets = [(alien_width + 2 * alien_width * index, 100.0) for index in range(volley)]
+    cos_path = Paths.math() / "cos.csv"
+
+    def cosines() -> list[float]:
+        return [abs(x - ship[0]) / math.hypot(x - ship[0], y - ship[1]) for x, y in bullets]
+
+    cases = {
+        "csv per bullet": lambda: [legacy_find_angle(cos_path, cos) for cos in cosines()],
+        "cached table": lambda: [fa.find_angle(cos_path, cos) for cos in cosines()],
+        "atan2": lambda: [math.degrees(math.atan2(abs(y - ship[1]), abs(x - ship[0]))) for x, y in bullets],
+    }
+    sys.stdout.write(f"volley of {volley} bullets, best of 5 x {REPEAT}\n")
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=REPEAT, repeat=5)) / REPEAT
+        sys.stdout.write(f"{name:>16}: {best * 1e6:10.1f} us/volley\n")
+
+
+if __name__ == "__main__":
+    main()
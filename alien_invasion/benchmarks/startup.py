@@ -0,0 +1,87 @@
+"""Import time of the game with lazy images, time to decode all images and time to load them from image cache.
+
+Every measurement runs in fresh interpreter, so nothing is cached between runs, except image cache file.
+Run from alien_invasion directory: python -m benchmarks.startup
+
+"""
+import json
+import subprocess  # ruff:ignore[suspicious-subprocess-import]
+import sys
+import tempfile
+from pathlib import Path
+
+REPEAT = 5
+
+MEASURE = """
+import json, os, time
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+start = time.perf_counter()
+import run
+from game import images
+imported = time.perf_counter()
+decoded_on_import = sum(asset.loaded for asset in images.registry.values())
+for asset in images.registry.values():
+    asset.decode()
+decoded = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "decode": decoded - imported,
+    "assets": len(images.registry),
+    "decoded_on_import": decoded_on_import,
+}))
+"""
+
+# Decode and convert all images, or load them from cache at given path, after display mode is set.
+MEASURE_DISPLAY = """
+import json, os, sys, time
+from pathlib import Path
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+import pygame
+import run
+from game import images
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+start = time.perf_counter()
+if len(sys.argv) > 1:
+    images.open_cache(Path(sys.argv[1]))
+    for asset in images.registry.values():
+        asset.get()
+else:
+    for asset in images.registry.values():
+        asset.decode()
+    images.convert(images.registry.values())
+print(json.dumps({"load": time.perf_counter() - start}))
+"""
+
+
+def measure(script: str, *args: str) -> dict[str, float]:
+    output = subprocess.run([sys.executable, "-c", script, *args],  # ruff:ignore[subprocess-without-shell-equals-true]
+                            capture_output=True,
+                            check=True,
+                            text=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    runs = [measure(MEASURE) for _ in range(REPEAT)]
+    best_import = min(run["import"] for run in runs)
+    best_decode = min(run["decode"] for run in runs)
+    sys.stdout.write(f"best of {REPEAT} fresh interpreters, {runs[0]['assets']:.0f} assets registered\n")
+    sys.stdout.write(f"{'lazy import':>24}: {best_import * 1e3:8.1f} ms, "
+                     f"{runs[0]['decoded_on_import']:.0f} assets decoded\n")
+    sys.stdout.write(f"{'eager import (estimate)':>24}: {(best_import + best_decode) * 1e3:8.1f} ms, "
+                     f"all assets decoded\n")
+
+    best_decode = min(measure(MEASURE_DISPLAY)["load"] for _ in range(REPEAT))
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "images.cache")
+        build = measure(MEASURE_DISPLAY, path)["load"]
+        best_cached = min(measure(MEASURE_DISPLAY, path)["load"] for _ in range(REPEAT))
+    sys.stdout.write(f"{'decode and convert':>24}: {best_decode * 1e3:8.1f} ms\n")
+    sys.stdout.write(f"{'build image cache':>24}: {build * 1e3:8.1f} ms\n")
+    sys.stdout.write(f"{'load from image cache':>24}: {best_cached * 1e3:8.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Worst step cost of enemy volley: every bullet spawned on fire step against volley spread over steps within budget.
+
+Run from alien_invasion directory: python -m benchmarks.volley
+
+"""
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from pygame.surface import Surface
+
+from game.enemy_bullets import VOLLEY_BUDGET, EnemyBullets, velocities, velocity
+from game.settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+REPEAT = 200
+VOLLEY_SIZES = (9, 50, 200)
+
+
+def legacy_fire(bullets: EnemyBullets, size: int, speed: float, image: Surface) -> None:
+    # Implementation before volleys: direction computed and bullet spawned one by one on fire step.
+    for angle in range(size):
+        bullets.spawn((600.0, 100.0), velocity(angle, speed), image)
+
+
+def volley_fire(bullets: EnemyBullets, size: int, speed: float, image: Surface) -> None:
+    bullets.spawn_volley([(600.0, 100.0)] * size, velocities(range(size), speed), image)
+
+
+def measure(fire: Callable[[EnemyBullets, int, float, Surface], None], size: int, settings: Settings) -> list[float]:
+    # Best time of every step from fire step until whole volley has spawned.
+    image = Surface((10, 10))
+    dt = 1000 / settings.simulation_rate
+    best: list[float] = []
+    for _ in range(REPEAT):
+        bullets = EnemyBullets()
+        steps = []
+        start = time.perf_counter()
+        fire(bullets, size, settings.alien_bullets_speed, image)
+        bullets.update(dt)
+        steps.append(time.perf_counter() - start)
+        while bullets.pending:
+            start = time.perf_counter()
+            bullets.update(dt)
+            steps.append(time.perf_counter() - start)
+        best = [min(pair) for pair in zip(best, steps, strict=True)] if best else steps
+    return best
+
+
+def main() -> None:
+    settings = Settings(health=None)
+    sys.stdout.write(f"best of {REPEAT} per step, volley budget {VOLLEY_BUDGET} bullets per step\n")
+    for size in VOLLEY_SIZES:
+        row = [f"{size:>4} bullets"]
+        for name, fire in (("at once", legacy_fire), ("volley", volley_fire)):
+            steps = measure(fire, size, settings)
+            row.append(f"{name}: worst step {max(steps) * 1e6:7.1f} us over {len(steps):>2} steps")
+        sys.stdout.write(", ".join(row) + "\n")
+
+
+if __name__ == "__main__":
+    main()
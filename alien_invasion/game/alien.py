@@ -1,13 +1,13 @@
-import secrets
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
-import pygame
 from pygame.sprite import Sprite
 
-from game.images import load_image
+from game.images import Image
+from game.spawn import SpawnRange
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
+    from pygame.rect import FRect, Rect
     from pygame.sprite import Group
     from pygame.surface import Surface
 
@@ -16,15 +16,34 @@ if TYPE_CHECKING:
     from game.ship import Ship
 
 
-def collidable(alien: Alien, other: Alien) -> bool:
-    # check collision between two aliens
-    if alien is other:
-        return False
-    return alien.rect.colliderect(other.rect)
+def merge_fleet(aliens: Group[Alien]) -> None:
+    """Merge colliding aliens: alien earlier in fleet stays, aliens overlapping it are removed.
+
+    Overlaps are found with sort and sweep along x axis, so only aliens with intersecting x ranges are compared.
+
+    """
+    fleet: list[Alien] = aliens.sprites()
+    by_left = sorted(fleet, key=lambda alien: alien.rect.left)
+    overlaps: defaultdict[Alien, list[Alien]] = defaultdict(list)
+    for index, alien in enumerate(by_left):
+        rect = alien.rect
+        for other_index in range(index + 1, len(by_left)):
+            other = by_left[other_index]
+            if other.rect.left >= rect.right:
+                break
+            if rect.colliderect(other.rect):
+                overlaps[alien].append(other)
+                overlaps[other].append(alien)
+
+    merged: set[Alien] = set()
+    for alien in fleet:
+        if alien not in merged:
+            merged.update(overlaps[alien])
+    aliens.remove(*merged)
 
 
 class Alien(Sprite):
-    IMAGE = load_image("aliens/green_alien.png")
+    IMAGE = Image("aliens/green_alien.png")
 
     def __init__(self, settings: Settings, screen: Screen, ship: Ship) -> None:
         super().__init__()
@@ -32,54 +51,29 @@ class Alien(Sprite):
         self.settings = settings
         self.image: Surface = self.IMAGE
 
-        # Get the rectangular area of the image.
-        self.rect: Rect = self.image.get_rect()
+        # Alien position, fleet moves it once alien joins the fleet.
+        self.rect: FRect = self.image.get_frect()
         self.screen_rect = self.screen.rect
 
-        # Every new aliens spawns in random area of the screen from allowed coordinates.
-        self.banned_coordinates = list(range(int(ship.centery - 200.0), int(ship.centery + 206.0)))
-        self.available_coordinates = [y for y in range(60, self.screen_rect.bottom - self.rect.height) if
-                                      y not in self.banned_coordinates]
-        self.rect.centery = secrets.choice(self.available_coordinates)
-
-        # Current position of alien.
-        self.x = self.rect.centerx
-        self.y = self.rect.centery
+        # Every new aliens spawns in random area of the screen away from ship.
+        spawn_y = SpawnRange(60,
+                             self.screen_rect.bottom - self.image.get_height(),
+                             range(int(ship.rect.centery - 200.0), int(ship.rect.centery + 206.0)))
+        self.rect.centery = spawn_y.choice()
 
         self.speed = self.settings.aliens_speed
 
-    def update(self, aliens: Group[Alien], ship: Ship) -> None:
-        """Update aliens position depending on ship current position. Check for collision between aliens."""
-        aliens_collision = pygame.sprite.spritecollide(self, aliens, dokill=False, collided=collidable)
-        if aliens_collision:
-            for alien in aliens_collision:
-                aliens.remove(alien)
-
-        if self.x > ship.centerx:
-            self.x -= self.speed  # type: ignore[assignment]
-            self.rect.centerx = self.x
-        if self.y > ship.centery:
-            self.y -= self.speed  # type: ignore[assignment]
-            self.rect.centery = self.y
-        if self.x < ship.centerx:
-            self.x += self.speed  # type: ignore[assignment]
-            self.rect.centerx = self.x
-        if self.y < ship.centery:
-            self.y += self.speed  # type: ignore[assignment]
-            self.rect.centery = self.y
-
     def adjust_in_fleet(self, index: int) -> None:
         alien_width = self.rect.width
-        self.x = alien_width + 2 * alien_width * index
-        self.rect.x = self.x
+        self.rect.x = alien_width + 2 * alien_width * index
 
-    def blitme(self) -> None:
-        self.screen.it.blit(self.image, self.rect)
+    def blitme(self, rect: Rect | FRect) -> Rect:
+        return self.screen.it.blit(self.image, rect)
 
 
 class RedAlien(Alien):
-    IMAGE = load_image("aliens/red_alien.png")
+    IMAGE = Image("aliens/red_alien.png")
 
 
 class BlueAlien(Alien):
-    IMAGE = load_image("aliens/blue_alien.png")
+    IMAGE = Image("aliens/blue_alien.png")
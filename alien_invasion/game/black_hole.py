@@ -1,13 +1,13 @@
-import secrets
 from collections import deque
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING
 
 from pygame.sprite import Sprite
 
-from game.images import load_sequential_from_dirs
+from game.images import ImageSequence
+from game.spawn import SpawnRange
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
+    from pygame.rect import FRect, Rect
     from pygame.surface import Surface
 
     from game.screen import Screen
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 
 
 class BlackHole(Sprite):
-    ROTATION_IMAGES: ClassVar[list[Surface]] = load_sequential_from_dirs("black_hole")
+    ROTATION_IMAGES = ImageSequence("black_hole")
 
     def __init__(self,
                  settings: Settings,
@@ -32,24 +32,20 @@ class BlackHole(Sprite):
 
         self.rect: Rect = self.image.get_rect()
 
-        # Black holes spawns in random area of screen from allowed coordinates.
-        self.banned_coordinates_x_1 = list(range(int(ship.centerx - 100.0), int(ship.centerx + 106.0)))
-        self.banned_coordinates_x_2 = list(range(int(self.screen_rect.centerx - 150.0),
-                                                 int(self.screen_rect.centerx + 150.0)))
-        self.banned_coordinates_x = list(set(self.banned_coordinates_x_1 + self.banned_coordinates_x_2))
-        self.available_coordinates_x = [x for x in range(100, self.screen_rect.right - 100) if
-                                        x not in self.banned_coordinates_x]
-        self.banned_coordinates_y_1 = list(range(int(ship.centery - 100.0), int(ship.centery + 106.0)))
-        self.banned_coordinates_y_2 = list(range(int(self.screen_rect.centery - 150.0),
-                                                 int(self.screen_rect.centery + 150.0)))
-        self.banned_coordinates_y = list(set(self.banned_coordinates_y_1 + self.banned_coordinates_y_2))
-        self.available_coordinates_y = [y for y in range(100, self.screen_rect.bottom - 100) if
-                                        y not in self.banned_coordinates_y]
-        self.rect.centerx = secrets.choice(self.available_coordinates_x)
-        self.rect.centery = secrets.choice(self.available_coordinates_y)
-
-    def blitme(self) -> None:
-        self.screen.it.blit(self.image, self.rect)
+        # Black holes spawns in random area of screen away from ship and screen center.
+        spawn_x = SpawnRange(100,
+                             self.screen_rect.right - 100,
+                             range(int(ship.rect.centerx - 100.0), int(ship.rect.centerx + 106.0)),
+                             range(int(self.screen_rect.centerx - 150.0), int(self.screen_rect.centerx + 150.0)))
+        spawn_y = SpawnRange(100,
+                             self.screen_rect.bottom - 100,
+                             range(int(ship.rect.centery - 100.0), int(ship.rect.centery + 106.0)),
+                             range(int(self.screen_rect.centery - 150.0), int(self.screen_rect.centery + 150.0)))
+        self.rect.centerx = spawn_x.choice()
+        self.rect.centery = spawn_y.choice()
+
+    def blitme(self, rect: Rect | FRect) -> Rect:
+        return self.screen.it.blit(self.image, rect)
 
     def update(self) -> None:
         """Change image of black hole to make animation effect."""
@@ -1,140 +1,62 @@
-import math
-from typing import TYPE_CHECKING
+from abc import abstractmethod
+from typing import TYPE_CHECKING, ClassVar
 
-from pygame.sprite import Sprite
-
-from game.gf import direct_bullet
-from game.images import load_image
+from game.images import Image
+from game.patterns import Scatter, Spiral, Spread
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
-    from pygame.surface import Surface
-
-    from game.bosses import BlueBoss, GreenBoss, RedBoss
-    from game.screen import Screen
+    from game.bosses import Boss
+    from game.enemy_bullets import EnemyBullets
+    from game.patterns import Pattern
     from game.settings import Settings
     from game.ship import Ship
 
 
-class BossBullet(Sprite):
-    IMAGE = load_image("aliens/green_alien_bullet.png")
+class BossBullet:
+    IMAGE = Image("aliens/green_alien_bullet.png", atlas=True)
+    PATTERN: ClassVar[Pattern]
 
-    def __init__(self, screen: Screen) -> None:
-        super().__init__()
-        self.screen = screen
-        self.image: Surface = self.IMAGE
-        self.rect: Rect = self.image.get_rect()
+    @classmethod
+    @abstractmethod
+    def speed(cls, settings: Settings) -> float:
+        pass
 
-    def blitme(self) -> None:
-        """Draw bullet on screen."""
-        self.screen.it.blit(self.image, self.rect)
+    @classmethod
+    def fire(cls, settings: Settings, bullets: EnemyBullets, boss: Boss, ship: Ship) -> None:
+        """Fire next volley of pattern from boss."""
+        speed = cls.speed(settings)
+        directions = cls.PATTERN.volley(boss.volleys, boss.rect.center, ship)
+        boss.volleys += 1
+        bullets.spawn_volley([boss.rect.center] * len(directions),
+                             [(x * speed, y * speed) for x, y in directions],
+                             cls.IMAGE,
+                             bounces=cls.PATTERN.bounces)
 
 
 class GreenBossBullet(BossBullet):
+    PATTERN = Scatter(period=1650,
+                      delay=300,
+                      bounces=4,
+                      ranges=(range(180), range(90, 270), range(180, 360), range(270, 450)))
 
-    def __init__(self, settings: Settings, screen: Screen, boss: GreenBoss) -> None:
-        super().__init__(screen)
-
-        self.screen_rect = self.screen.rect
-
-        # Set starting position of boss.
-        self.rect.centerx = boss.rect.centerx
-        self.rect.centery = boss.rect.centery
-
-        # Current position of bullet.
-        self.x = self.rect.centerx
-        self.y = self.rect.centery
-
-        # Bullet speed.
-        self.speed = settings.green_boss_bullets_speed
-
-        # Angle of bullet direction.
-        self.shooting_angle_up = 0
-
-        # Counter of bounces bullets make, when they collide with screen borders.
-        self.bounces = 0
-
-    def update(self) -> None:
-        """Update bullet position."""
-        angle = self.shooting_angle_up
-        radians = math.radians(angle)
-        bullet_move_x = self.speed * math.cos(radians)
-        bullet_move_y = -self.speed * math.sin(radians)
-        self.x += bullet_move_x  # type: ignore[assignment]
-        self.y += bullet_move_y  # type: ignore[assignment]
-        self.rect.centery = self.y
-        self.rect.centerx = self.x
-
-    def change_direction(self) -> None:
-        """Change bullet direction after it reaching screen borders."""
-        if (self.rect.top <= 0) or (self.rect.bottom > self.screen_rect.bottom):
-            self.shooting_angle_up = 360 - self.shooting_angle_up
-            self.bounces += 1
-        elif self.rect.right > self.screen_rect.right:
-            self.shooting_angle_up = abs(270 - self.shooting_angle_up) + 180
-            self.bounces += 1
-        elif self.rect.left < self.screen_rect.left:
-            self.shooting_angle_up = 180 - self.shooting_angle_up
-            self.bounces += 1
+    @classmethod
+    def speed(cls, settings: Settings) -> float:
+        return settings.green_boss_bullets_speed
 
 
 class RedBossBullet(BossBullet):
-    IMAGE = load_image("aliens/red_alien_bullet.png")
-
-    def __init__(self, settings: Settings, screen: Screen, boss: RedBoss) -> None:
-        super().__init__(screen=screen)
+    IMAGE = Image("aliens/red_alien_bullet.png", atlas=True)
+    PATTERN = Spread(period=1350, angles=(0, 15, 30, -15, -30))
 
-        self.screen_rect = self.screen.rect
-
-        # Set starting position of boss.
-        self.rect.centerx = boss.rect.centerx
-        self.rect.centery = boss.rect.centery
-
-        # Current position of bullet.
-        self.x = self.rect.centerx
-        self.y = self.rect.centery
-
-        self.speed = settings.red_boss_bullets_speed
-        self.ship_position: direct_bullet.ShipToBulletPosition | None = None
-        self.shooting_angle_cos = 0.0
-        self.shooting_angle = 0.0
-
-    def update(self) -> None:
-        direct_bullet.update_direct_bullet(bullet=self)
-
-    def define_position(self, ship: Ship) -> None:
-        direct_bullet.define_direct_bullet_position(bullet=self, ship=ship)
+    @classmethod
+    def speed(cls, settings: Settings) -> float:
+        return settings.red_boss_bullets_speed
 
 
 class BlueBossBullet(BossBullet):
-    IMAGE = load_image("aliens/blue_alien_bullet.png")
-
-    def __init__(self,
-                 settings: Settings,
-                 screen: Screen,
-                 boss: BlueBoss,
-                 angle: int) -> None:
-        super().__init__(screen=screen)
-
-        self.screen_rect = self.screen.rect
-
-        # Set starting position of boss.
-        self.rect.centerx = boss.rect.centerx
-        self.rect.centery = boss.rect.centery
-
-        # Current position of bullet.
-        self.x = self.rect.centerx
-        self.y = self.rect.centery
-
-        self.speed = settings.blue_boss_bullets_speed
-        self.angle = angle
+    IMAGE = Image("aliens/blue_alien_bullet.png", atlas=True)
+    PATTERN = Spiral(period=300, angles=(30, 120, 210, 300), step=15, limits=(0, 400))
 
-    def update(self) -> None:
-        """Update bullet position."""
-        radians = math.radians(self.angle)
-        bullet_move_x = self.speed * math.cos(radians)
-        bullet_move_y = -self.speed * math.sin(radians)
-        self.x += bullet_move_x  # type: ignore[assignment]
-        self.y += bullet_move_y  # type: ignore[assignment]
-        self.rect.centery = self.y
-        self.rect.centerx = self.x
+    @classmethod
+    def speed(cls, settings: Settings) -> float:
+        return settings.blue_boss_bullets_speed
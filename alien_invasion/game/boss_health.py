@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, TypeAlias, Union
 
 from pygame.sprite import Sprite
 
-from game.images import load_sequential_from_dirs
+from game.images import ImageSequence
 
 if TYPE_CHECKING:
     from pygame.surface import Surface
@@ -24,13 +24,13 @@ class BossHudShield(BossHudHealth):
 
 
 class GreenBossHealth(Sprite):
-    HUD_HEALTH = BossHudHealth(load_sequential_from_dirs("green_boss_hp"))
-    HUD_SHIELD = BossHudShield(load_sequential_from_dirs("green_boss_shield"))
+    HUD_HEALTH = ImageSequence("green_boss_hp")
+    HUD_SHIELD = ImageSequence("green_boss_shield")
 
     def __init__(self) -> None:
         super().__init__()
-        self.hud_health = self.HUD_HEALTH
-        self.hud_shield = self.HUD_SHIELD
+        self.hud_health = BossHudHealth(self.HUD_HEALTH)
+        self.hud_shield = BossHudShield(self.HUD_SHIELD)
         self.images = deque(self.hud_health + self.hud_shield)
         self.image: Surface = self.hud_health[-1]
         self.rect = self.image.get_rect()
@@ -43,10 +43,10 @@ class GreenBossHealth(Sprite):
 
 
 class RedBossHealth(GreenBossHealth):
-    HUD_HEALTH = BossHudHealth(load_sequential_from_dirs("red_boss_hp"))
-    HUD_SHIELD = BossHudShield(load_sequential_from_dirs("red_boss_shield"))
+    HUD_HEALTH = ImageSequence("red_boss_hp")
+    HUD_SHIELD = ImageSequence("red_boss_shield")
 
 
 class BlueBossHealth(GreenBossHealth):
-    HUD_HEALTH = BossHudHealth(load_sequential_from_dirs("blue_boss_hp"))
-    HUD_SHIELD = BossHudShield(load_sequential_from_dirs("blue_boss_shield"))
+    HUD_HEALTH = ImageSequence("blue_boss_hp")
+    HUD_SHIELD = ImageSequence("blue_boss_shield")
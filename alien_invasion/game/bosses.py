@@ -1,14 +1,14 @@
-import secrets
 from typing import TYPE_CHECKING
 
 from pygame.sprite import Sprite
 
+from game import rng
 from game.boss_health import BlueBossHealth, GreenBossHealth, RedBossHealth
-from game.images import load_image
+from game.images import Image
 from game.screen import ScreenSide as Side
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
+    from pygame.rect import FRect, Rect
     from pygame.surface import Surface
 
     from game.boss_health import BossHealthTypes
@@ -26,15 +26,13 @@ class Boss(Sprite):
         self.image: Surface = image
         self.combined_health = health
 
-        # Rectangular area of the image.
-        self.rect: Rect = self.image.get_rect()
-
-        # Set starting position of boss.
+        # Boss position, starting at the center of screen.
         self.screen_rect = screen.rect
-        self.rect.centerx = self.screen_rect.centerx
-        self.rect.centery = self.screen_rect.centery
+        self.rect: FRect = self.image.get_frect(center=self.screen_rect.center)
 
         self.set_default_health_points()
+        # Count of fired volleys, it is current step of bullet pattern.
+        self.volleys = 0
 
     def prepare_health(self) -> None:
         self.combined_health.rotate()
@@ -45,12 +43,12 @@ class Boss(Sprite):
     def set_default_health_points(self) -> None:
         self.health_points = self.combined_health.hit_points
 
-    def blitme(self) -> None:
-        self.screen.it.blit(self.image, self.rect)
+    def blitme(self, rect: Rect | FRect) -> Rect:
+        return self.screen.it.blit(self.image, rect)
 
 
 class GreenBoss(Boss):
-    IMAGE = load_image("aliens/green_alien.png")
+    IMAGE = Image("aliens/green_alien.png")
 
     def __init__(self, screen: Screen) -> None:
         image = self.IMAGE
@@ -59,16 +57,13 @@ class GreenBoss(Boss):
 
 
 class RedBoss(Boss):
-    IMAGE = load_image("aliens/red_alien.png")
+    IMAGE = Image("aliens/red_alien.png")
 
     def __init__(self, settings: Settings, screen: Screen) -> None:
         image = self.IMAGE
         health = RedBossHealth()
         super().__init__(screen=screen, image=image, health=health)
 
-        self.x = float(self.rect.centerx)
-        self.y = float(self.rect.centery)
-
         self.position: Side = Side.CENTER
         self.define_direction(Side.LEFT, Side.RIGHT, Side.TOP, Side.BOTTOM)
 
@@ -158,97 +153,79 @@ class RedBoss(Boss):
                 (Side.RIGHT, Side.BOTTOM),
             ),
             (Side.TOP_LEFT, Side.TOP): (
-                lambda: self.x < self.screen_rect.centerx,
+                lambda: self.rect.centerx < self.screen_rect.centerx,
                 self.go_right,
                 (Side.CENTER, Side.TOP_LEFT, Side.TOP_RIGHT),
             ),
             (Side.TOP_LEFT, Side.LEFT): (
-                lambda: self.y < self.screen_rect.centery,
+                lambda: self.rect.centery < self.screen_rect.centery,
                 self.go_down,
                 (Side.CENTER, Side.TOP_LEFT, Side.BOTTOM_LEFT),
             ),
             (Side.BOTTOM_LEFT, Side.BOTTOM): (
-                lambda: self.x < self.screen_rect.centerx,
+                lambda: self.rect.centerx < self.screen_rect.centerx,
                 self.go_right,
                 (Side.CENTER, Side.BOTTOM_LEFT, Side.BOTTOM_RIGHT),
             ),
             (Side.BOTTOM_LEFT, Side.LEFT): (
-                lambda: self.y > self.screen_rect.centery,
+                lambda: self.rect.centery > self.screen_rect.centery,
                 self.go_up,
                 (Side.CENTER, Side.TOP_LEFT, Side.BOTTOM_LEFT),
             ),
             (Side.BOTTOM_RIGHT, Side.BOTTOM): (
-                lambda: self.x > self.screen_rect.centerx,
+                lambda: self.rect.centerx > self.screen_rect.centerx,
                 self.go_left,
                 (Side.CENTER, Side.BOTTOM_LEFT, Side.BOTTOM_RIGHT),
             ),
             (Side.BOTTOM_RIGHT, Side.RIGHT): (
-                lambda: self.y > self.screen_rect.centery,
+                lambda: self.rect.centery > self.screen_rect.centery,
                 self.go_up,
                 (Side.CENTER, Side.TOP_RIGHT, Side.BOTTOM_RIGHT),
             ),
             (Side.TOP_RIGHT, Side.TOP): (
-                lambda: self.x > self.screen_rect.centerx,
+                lambda: self.rect.centerx > self.screen_rect.centerx,
                 self.go_left,
                 (Side.CENTER, Side.TOP_LEFT, Side.TOP_RIGHT),
             ),
             (Side.TOP_RIGHT, Side.RIGHT): (
-                lambda: self.y < self.screen_rect.centery,
+                lambda: self.rect.centery < self.screen_rect.centery,
                 self.go_down,
                 (Side.CENTER, Side.TOP_RIGHT, Side.BOTTOM_RIGHT),
             ),
         }
 
-    def update_coordinates(self) -> None:
-        self.rect.centerx = self.x  # type: ignore[assignment]
-        self.rect.centery = self.y  # type: ignore[assignment]
-
-    def go_up(self) -> None:
-        self.y -= self.speed
-        self.update_coordinates()
+    def go_up(self, dt: float) -> None:
+        self.rect.centery -= self.speed * dt
 
-    def go_left(self) -> None:
-        self.x -= self.speed
-        self.update_coordinates()
+    def go_left(self, dt: float) -> None:
+        self.rect.centerx -= self.speed * dt
 
-    def go_down(self) -> None:
-        self.y += self.speed
-        self.update_coordinates()
+    def go_down(self, dt: float) -> None:
+        self.rect.centery += self.speed * dt
 
-    def go_right(self) -> None:
-        self.x += self.speed
-        self.update_coordinates()
+    def go_right(self, dt: float) -> None:
+        self.rect.centerx += self.speed * dt
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         action = self.movement_map.get((self.position, self.direction))
         if not action:
             return
 
         condition, move_function, next_directions = action
         if condition():
-            move_function()
+            move_function(dt)
         else:
             self.position = self.direction
             self.define_direction(*next_directions)
 
     def define_direction(self, *sides: Side) -> None:
-        self.direction = secrets.choice(sides)
+        self.direction = rng.choice(sides)
 
 
 class BlueBoss(Boss):
-    IMAGE = load_image("aliens/blue_alien.png")
+    IMAGE = Image("aliens/blue_alien.png")
 
     def __init__(self, screen: Screen) -> None:
         image = self.IMAGE
         health = BlueBossHealth()
         super().__init__(screen=screen, image=image, health=health)
-
-        # Current position of bullet.
-        self.x = float(self.rect.centerx)
-        self.y = float(self.rect.centery)
-
-        # Angle to manipulate shooting direction.
-        self.shooting_angle = 0
-
-        # Trigger, that defines clock direction of boss: clockwise, counter-clockwise.
-        self.rt_trigger = True
@@ -2,108 +2,52 @@ from typing import TYPE_CHECKING
 
 from pygame.sprite import Sprite
 
-from game.images import load_image
+from game.images import Image
 from game.screen import ScreenSide
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
+    from pygame.rect import FRect, Rect
     from pygame.surface import Surface
 
     from game.screen import Screen
     from game.settings import Settings
     from game.ship import Ship
 
+# Spawn offset from ship center and direction of bullet for every ship rotation.
+# Diagonal bullets move by full distance along both axes.
+MUZZLES: dict[ScreenSide, tuple[tuple[float, float], tuple[float, float]]] = {
+    ScreenSide.TOP: ((0, -35), (0, -1)),
+    ScreenSide.RIGHT: ((30, 5), (1, 0)),
+    ScreenSide.LEFT: ((-45, 5), (-1, 0)),
+    ScreenSide.BOTTOM: ((-1, 35), (0, 1)),
+    ScreenSide.TOP_RIGHT: ((24, -27), (1, -1)),
+    ScreenSide.TOP_LEFT: ((-30, -30), (-1, -1)),
+    ScreenSide.BOTTOM_LEFT: ((-33, 30), (-1, 1)),
+    ScreenSide.BOTTOM_RIGHT: ((27, 32), (1, 1)),
+}
+
 
 class Bullet(Sprite):
-    IMAGE = load_image("bullet.png")
+    __slots__ = ("screen", "vx", "vy")
+
+    IMAGE = Image("bullet.png", atlas=True)
 
     def __init__(self, settings: Settings, screen: Screen, ship: Ship) -> None:
         super().__init__()
         self.screen = screen
         self.image: Surface = self.IMAGE
 
-        # Get the rectangular area of the image.
-        self.rect: Rect = self.image.get_rect()
-
-        # Set starting position of bullet at the center of ship.
-        self.rect.centerx = ship.rect.centerx
-        self.rect.centery = ship.rect.centery
-
-        # Current bullet position for different ship positions.
-        # For UP position of ship.
-        self.y_up = float(self.rect.centery) - 35
-        self.x_up = float(self.rect.centerx)
-
-        # For RIGHT position of ship.
-        self.y_right = float(self.rect.centery) + 5
-        self.x_right = float(self.rect.centerx) + 30
-
-        # For LEFT position of ship.
-        self.y_left = float(self.rect.centery) + 5
-        self.x_left = float(self.rect.centerx) - 45
-
-        # For DOWN position of ship.
-        self.y_down = float(self.rect.centery) + 35
-        self.x_down = float(self.rect.centerx) - 1
-
-        # For UP_RIGHT position of ship.
-        self.y_up_right = float(self.rect.centery) - 27
-        self.x_up_right = float(self.rect.centerx) + 24
-
-        # For UP_LEFT position of ship.
-        self.y_up_left = float(self.rect.centery) - 30
-        self.x_up_left = float(self.rect.centerx) - 30
-
-        # For DOWN_LEFT position of ship.
-        self.y_down_left = float(self.rect.centery) + 30
-        self.x_down_left = float(self.rect.centerx) - 33
-
-        # For DOWN_RIGHT position of ship.
-        self.y_down_right = float(self.rect.centery) + 32
-        self.x_down_right = float(self.rect.centerx) + 27
+        # Bullet position, starting at muzzle of ship.
+        (offset_x, offset_y), (direction_x, direction_y) = MUZZLES[ship.current_ship_rotation]
+        self.rect: FRect = self.image.get_frect(center=(ship.rect.centerx + offset_x, ship.rect.centery + offset_y))
 
-        self.speed_factor = settings.bullet_speed_factor
-        self.bullet_rotation = ship.current_ship_rotation
+        # Velocity in pixels per millisecond.
+        self.vx = direction_x * settings.bullet_speed_factor
+        self.vy = direction_y * settings.bullet_speed_factor
 
-    def update(self) -> None:
-        """Update bullet position depending on ship current rotation."""
-        match self.bullet_rotation:
-            case ScreenSide.TOP:
-                self.y_up -= self.speed_factor
-                self.rect.centery = self.y_up  # type: ignore[assignment]
-                self.rect.centerx = self.x_up  # type: ignore[assignment]
-            case ScreenSide.RIGHT:
-                self.x_right += self.speed_factor
-                self.rect.centerx = self.x_right  # type: ignore[assignment]
-                self.rect.centery = self.y_right  # type: ignore[assignment]
-            case ScreenSide.LEFT:
-                self.x_left -= self.speed_factor
-                self.rect.centerx = self.x_left  # type: ignore[assignment]
-                self.rect.centery = self.y_left  # type: ignore[assignment]
-            case ScreenSide.BOTTOM:
-                self.y_down += self.speed_factor
-                self.rect.centery = self.y_down  # type: ignore[assignment]
-                self.rect.centerx = self.x_down  # type: ignore[assignment]
-            case ScreenSide.TOP_RIGHT:
-                self.y_up_right -= self.speed_factor
-                self.x_up_right += self.speed_factor
-                self.rect.centery = self.y_up_right  # type: ignore[assignment]
-                self.rect.centerx = self.x_up_right  # type: ignore[assignment]
-            case ScreenSide.TOP_LEFT:
-                self.y_up_left -= self.speed_factor
-                self.x_up_left -= self.speed_factor
-                self.rect.centery = self.y_up_left  # type: ignore[assignment]
-                self.rect.centerx = self.x_up_left  # type: ignore[assignment]
-            case ScreenSide.BOTTOM_LEFT:
-                self.y_down_left += self.speed_factor
-                self.x_down_left -= self.speed_factor
-                self.rect.centery = self.y_down_left  # type: ignore[assignment]
-                self.rect.centerx = self.x_down_left  # type: ignore[assignment]
-            case ScreenSide.BOTTOM_RIGHT:
-                self.y_down_right += self.speed_factor
-                self.x_down_right += self.speed_factor
-                self.rect.centery = self.y_down_right  # type: ignore[assignment]
-                self.rect.centerx = self.x_down_right  # type: ignore[assignment]
+    def update(self, dt: float) -> None:
+        """Move bullet in direction of ship rotation at the moment of shot."""
+        self.rect.move_ip(self.vx * dt, self.vy * dt)
 
-    def blitme(self) -> None:
-        self.screen.it.blit(self.image, self.rect)
+    def blitme(self, rect: Rect | FRect) -> Rect:
+        return self.screen.it.blit(self.image, rect)
@@ -1,17 +1,18 @@
 from typing import TYPE_CHECKING
 
 import pygame
-import pygame.font
 from pygame.color import Color
 
-from game.images import load_image
+from game.fonts import load_font
+from game.images import Image
 
 if TYPE_CHECKING:
+    from pygame.font import Font
     from pygame.surface import Surface
 
 
 class Button:
-    IMAGE = load_image("button.png")
+    IMAGE = Image("button.png")
 
     def __init__(self,
                  surface: Surface,
@@ -20,34 +21,41 @@ class Button:
                  button_color: Color | None = None,
                  text_color: Color | None = None,
                  hover_text_color: Color | None = None,
-                 font: pygame.font.Font | None = None) -> None:
+                 font: Font | None = None) -> None:
         self.surface = surface
         self.image = self.IMAGE
         self.message = message
         self.button_color = button_color or Color(176, 186, 231)
         self.text_color = text_color or Color(255, 255, 255)
         self.hover_text_color = hover_text_color or Color(150, 255, 255)
-        self.font = font or pygame.font.SysFont("tahoma", 40)
+        self.font = font or load_font(40)
 
         self.ellipse_rect = self.image.get_rect(**position)
+        self.hovered = False
         self.prepare_message(message)
 
+    def render(self, text_color: Color) -> Surface:
+        # Button image with message rendered over it.
+        surface = self.image.copy()
+        message = self.font.render(self.message, True, text_color, self.button_color)  # ruff:ignore[boolean-positional-value-in-call]
+        surface.blit(message, message.get_rect(center=surface.get_rect().center))
+        return surface
+
     def prepare_message(self, message: str) -> None:
-        self.msg_image = self.font.render(message, True, self.text_color, self.button_color)  # ruff:ignore[boolean-positional-value-in-call]
-        self.msg_image_rect = self.msg_image.get_rect(center=self.ellipse_rect.center)
+        """Render normal and hover states of button once, drawing only picks one of them."""
+        self.message = message
+        self.normal_image = self.render(self.text_color)
+        self.hover_image = self.render(self.hover_text_color)
 
-    def update(self, mouse_position: tuple[float, float] | None = None) -> None:
+    def update(self, mouse_position: tuple[float, float] | None = None) -> bool:
+        # Update hover state, return True, when it has changed.
         if mouse_position is None:
             mouse_position = pygame.mouse.get_pos()
 
-        if not self.ellipse_rect.collidepoint(mouse_position):
-            self.prepare_message(self.message)
-            return
-
-        self.msg_image = self.font.render(self.message, True, self.hover_text_color, self.button_color)  # ruff:ignore[boolean-positional-value-in-call]
-        self.msg_image_rect = self.msg_image.get_rect()
-        self.msg_image_rect.center = self.ellipse_rect.center
+        hovered = bool(self.ellipse_rect.collidepoint(mouse_position))
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
 
     def draw(self) -> None:
-        self.surface.blit(self.image, self.ellipse_rect)
-        self.surface.blit(self.msg_image, self.msg_image_rect)
+        self.surface.blit(self.hover_image if self.hovered else self.normal_image, self.ellipse_rect)
@@ -0,0 +1,168 @@
+import math
+from collections import deque
+from itertools import compress
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from pygame.rect import FRect, Rect
+    from pygame.surface import Surface
+
+
+def velocity(angle: float, speed: float) -> tuple[float, float]:
+    # Velocity for angle in degrees, counted counter-clockwise from screen right.
+    radians = math.radians(angle)
+    return speed * math.cos(radians), -speed * math.sin(radians)
+
+
+def velocities(angles: Iterable[float], speed: float) -> list[tuple[float, float]]:
+    # Velocities of whole volley, see velocity.
+    return [velocity(angle, speed) for angle in angles]
+
+
+# Bullets spawned per simulation step at most, the rest of larger volley spawns on next steps.
+VOLLEY_BUDGET = 5
+
+
+class EnemyBullets:
+    """Enemy bullets stored as parallel lists instead of one sprite per bullet.
+
+    Bullet direction is computed once on spawn, every pass (move, bounce, cull, hit test, draw)
+    handles whole population at once without per bullet method calls and trigonometry.
+
+    """
+
+    def __init__(self) -> None:
+        self.x: list[float] = []
+        self.y: list[float] = []
+        self.previous_x: list[float] = []
+        self.previous_y: list[float] = []
+        # Velocity in pixels per millisecond.
+        self.vx: list[float] = []
+        self.vy: list[float] = []
+        # Bounces left before bullet is allowed to leave the screen.
+        self.bounces: list[int] = []
+        self.images: list[Surface] = []
+        self.rects: list[Rect] = []
+        # Bullets of volleys waiting for their step: position, velocity, image and bounces.
+        self.pending: deque[tuple[tuple[float, float], tuple[float, float], Surface, int]] = deque()
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __bool__(self) -> bool:
+        return bool(self.x)
+
+    def spawn(self,
+              position: tuple[float, float],
+              velocity: tuple[float, float],
+              image: Surface,
+              bounces: int = 0) -> None:
+        x, y = position
+        vx, vy = velocity
+        self.x.append(x)
+        self.y.append(y)
+        self.previous_x.append(x)
+        self.previous_y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.bounces.append(bounces)
+        self.images.append(image)
+        self.rects.append(image.get_rect(center=(x, y)))
+
+    def spawn_volley(self,
+                     positions: Sequence[tuple[float, float]],
+                     velocities: Sequence[tuple[float, float]],
+                     image: Surface,
+                     bounces: int = 0) -> None:
+        """Queue bullets of volley, they spawn on update, at most VOLLEY_BUDGET bullets per step.
+
+        Volley directions are computed at once by caller, while spawning is spread over a few steps,
+        so that large volley does not make a spike of step time.
+
+        """
+        self.pending.extend((position, velocity, image, bounces)
+                            for position, velocity in zip(positions, velocities, strict=True))
+
+    def release(self) -> None:
+        # Spawn queued bullets within budget of one step.
+        for _ in range(min(len(self.pending), VOLLEY_BUDGET)):
+            self.spawn(*self.pending.popleft())
+
+    def update(self, dt: float) -> None:
+        """Move all bullets and spawn queued ones at their positions."""
+        self.previous_x, self.previous_y = self.x, self.y
+        self.x = [x + vx * dt for x, vx in zip(self.x, self.vx, strict=True)]
+        self.y = [y + vy * dt for y, vy in zip(self.y, self.vy, strict=True)]
+        for rect, x, y in zip(self.rects, self.x, self.y, strict=True):
+            rect.center = (x, y)
+        if self.pending:
+            self.release()
+
+    def bounce(self, bounds: Rect) -> None:
+        """Reflect bullets with bounces left from bounds edges they are moving to.
+
+        Bullet is removed on its last bounce instead of being reflected.
+
+        """
+        spent: set[int] = set()
+        for index, rect in enumerate(self.rects):
+            if not self.bounces[index]:
+                continue
+            vx, vy = self.vx[index], self.vy[index]
+            if (rect.top <= bounds.top and vy < 0) or (rect.bottom > bounds.bottom and vy > 0):
+                self.vy[index] = -vy
+            elif (rect.right > bounds.right and vx > 0) or (rect.left < bounds.left and vx < 0):
+                self.vx[index] = -vx
+            else:
+                continue
+            self.bounces[index] -= 1
+            if not self.bounces[index]:
+                spent.add(index)
+        if spent:
+            self.keep([index not in spent for index in range(len(self))])
+
+    def cull(self, bounds: Rect) -> None:
+        """Remove bullets, which left bounds."""
+        self.keep([bounds.colliderect(rect) for rect in self.rects])
+
+    def collide(self, rect: Rect | FRect) -> bool:
+        return rect.collidelist(self.rects) != -1
+
+    def kill_colliding(self, rects: Iterable[Rect | FRect]) -> None:
+        """Remove bullets colliding with any of rects."""
+        hits = {index for rect in rects for index in rect.collidelistall(self.rects)}
+        if hits:
+            self.keep([index not in hits for index in range(len(self))])
+
+    def keep(self, selectors: list[bool]) -> None:
+        if all(selectors):
+            return
+        self.x = list(compress(self.x, selectors))
+        self.y = list(compress(self.y, selectors))
+        self.previous_x = list(compress(self.previous_x, selectors))
+        self.previous_y = list(compress(self.previous_y, selectors))
+        self.vx = list(compress(self.vx, selectors))
+        self.vy = list(compress(self.vy, selectors))
+        self.bounces = list(compress(self.bounces, selectors))
+        self.images = list(compress(self.images, selectors))
+        self.rects = list(compress(self.rects, selectors))
+
+    def empty(self) -> None:
+        self.keep([False] * len(self))
+        self.pending.clear()
+
+    def draw(self, surface: Surface, alpha: float = 1.0) -> list[Rect]:
+        """Draw all bullets between previous and current positions.
+
+        Returns:
+            :return: Drawn areas.
+
+        """
+        rects = [
+            rect.move(round((px - x) * (1 - alpha)), round((py - y) * (1 - alpha)))
+            for rect, x, y, px, py in zip(self.rects, self.x, self.y, self.previous_x, self.previous_y, strict=True)
+        ]
+        surface.fblits(zip(self.images, rects, strict=True))
+        return rects
@@ -1,4 +1,6 @@
 import csv
+from bisect import bisect_right
+from functools import cache
 from pathlib import Path
 
 from game.paths import Paths
@@ -30,13 +32,26 @@ def find_angle_with_sin(value: float) -> float:
     return find_angle(Paths.math() / "sin.csv", value)
 
 
-def find_angle(filepath: Path, value: float) -> float:
-    data = {}
+@cache
+def load_table(filepath: Path) -> tuple[list[float], list[int]]:
+    """Load trigonometric table once.
+
+    Args:
+        :param filepath: Path to csv file with "angle;value" rows.
+
+    Returns:
+        :return: Values sorted ascending and angles in the same order.
+
+    """
     with Path.open(filepath, encoding="utf-8") as f:
         reader = csv.reader(f, delimiter=";")
-        for row in reader:
-            data[float(row[1])] = int(row[0])
-    for x in sorted(data.keys()):
-        if x > value:
-            break
-    return data[x]
+        data = {float(row[1]): int(row[0]) for row in reader}
+    values = sorted(data)
+    return values, [data[value] for value in values]
+
+
+def find_angle(filepath: Path, value: float) -> float:
+    # Angle of the smallest table value greater than given one, or of the largest value.
+    values, angles = load_table(filepath)
+    index = min(bisect_right(values, value), len(values) - 1)
+    return angles[index]
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING
+
+from pygame.sprite import Group
+
+from game.alien import Alien
+
+if TYPE_CHECKING:
+    from game.ship import Ship
+
+
+class Fleet(Group[Alien]):
+    """Group of aliens, which keeps alien positions in parallel lists and moves whole fleet toward ship at once.
+
+    Lists are kept in sync with group membership, removed alien is replaced by the last one.
+
+    """
+
+    def __init__(self, *aliens: Alien) -> None:
+        self.aliens: list[Alien] = []
+        self.x: list[float] = []
+        self.y: list[float] = []
+        # Speed in pixels per millisecond.
+        self.speed: list[float] = []
+        self.index: dict[Alien, int] = {}
+        super().__init__(*aliens)
+
+    def add_internal(self, sprite: Alien, layer: int | None = None) -> None:
+        super().add_internal(sprite, layer)
+        self.index[sprite] = len(self.aliens)
+        self.aliens.append(sprite)
+        x, y = sprite.rect.center
+        self.x.append(x)
+        self.y.append(y)
+        self.speed.append(sprite.speed)
+
+    def remove_internal(self, sprite: Alien) -> None:
+        super().remove_internal(sprite)
+        index = self.index.pop(sprite)
+        last = self.aliens.pop()
+        x, y, speed = self.x.pop(), self.y.pop(), self.speed.pop()
+        if last is not sprite:
+            self.index[last] = index
+            self.aliens[index] = last
+            self.x[index], self.y[index], self.speed[index] = x, y, speed
+
+    def steer(self, ship: Ship, dt: float) -> None:
+        """Move all aliens toward ship and sync their rects.
+
+        On each axis alien steps toward ship, but does not step past it when coming from right or bottom.
+
+        """
+        target_x, target_y = ship.rect.center
+        steps = [speed * dt for speed in self.speed]
+        self.x = [
+            (x - step if x - step >= target_x else x) if x > target_x else x + step if x < target_x else x
+            for x, step in zip(self.x, steps, strict=True)
+        ]
+        self.y = [
+            (y - step if y - step >= target_y else y) if y > target_y else y + step if y < target_y else y
+            for y, step in zip(self.y, steps, strict=True)
+        ]
+        for alien, x, y in zip(self.aliens, self.x, self.y, strict=True):
+            alien.rect.center = (x, y)
@@ -0,0 +1,17 @@
+from functools import cache
+
+import pygame
+from pygame.font import Font
+
+from game.paths import Paths
+
+# Fonts are bundled with the game, so menus look the same everywhere and no system fonts are scanned.
+DEFAULT_FACE = "freesansbold"
+
+
+@cache
+def load_font(size: int, face: str = DEFAULT_FACE) -> Font:
+    # Font from fonts directory, shared by everyone asking for the same face and size.
+    # Fonts are invalid once pygame quits, e.g. between games in the same process, and quit forgets its callbacks.
+    pygame.register_quit(load_font.cache_clear)
+    return Font(Paths.fonts() / f"{face}.ttf", size)
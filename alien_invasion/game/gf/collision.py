@@ -1,41 +1,48 @@
-import time
 from typing import TYPE_CHECKING
 
 import pygame
 
 from game.gf import common
-from game.paths import Paths
+from game.sounds import Sounds
 
 if TYPE_CHECKING:
-    from pygame.sprite import Group
+    from pygame.sprite import Group, Sprite
 
     from game.boss_shield import BossShield
     from game.bosses import Boss
     from game.bullet import Bullet
+    from game.enemy_bullets import EnemyBullets
     from game.hud import Hud
     from game.screen import Screen
     from game.settings import Settings
     from game.ship import Ship
+    from game.spatial_hash import SpatialHash
     from game.sprites import Sprites
     from game.stats import Stats
 
 
-def check_ship_aliens_collision(ship: Ship, aliens: Group) -> list | None:
-    return pygame.sprite.spritecollideany(ship, aliens)
+def check_ship_aliens_collision(ship: Ship, aliens: SpatialHash) -> Sprite | None:
+    return aliens.collideany(ship.rect)
 
 
-def check_ship_alien_bullets_collision(ship: Ship, alien_bullets: Group) -> list | None:
-    return pygame.sprite.spritecollideany(ship, alien_bullets)
+def check_ship_bullets_aliens_collision(bullets: Group[Bullet], aliens: SpatialHash) -> None:
+    for bullet in bullets.sprites():
+        if hit := aliens.collide(bullet.rect):
+            bullet.kill()
+            for alien in hit:
+                alien.kill()
+
 
+def check_ship_alien_bullets_collision(ship: Ship, alien_bullets: EnemyBullets) -> bool:
+    return alien_bullets.collide(ship.rect)
 
-def check_ship_boss_bullets_collision(settings: Settings,
-                                      stats: Stats,
+
+def check_ship_boss_bullets_collision(stats: Stats,
                                       hud: Hud,
                                       ship: Ship,
-                                      sprites: Sprites) -> list | None:
-    if collided := pygame.sprite.spritecollideany(ship, sprites.boss_bullets):
-        common.ship_hit_on_boss_stage(settings=settings,
-                                      stats=stats,
+                                      sprites: Sprites) -> bool:
+    if collided := sprites.boss_bullets.collide(ship.rect):
+        common.ship_hit_on_boss_stage(stats=stats,
                                       hud=hud,
                                       ship=ship,
                                       sprites=sprites)
@@ -56,19 +63,17 @@ def check_ship_bullets_boss_collision(settings: Settings, sprites: Sprites) -> N
     boss.health_points -= 1
     boss.prepare_health()
     if boss.health_points < 1:
-        time.sleep(settings.game_sleep_time)
+        common.hit_stop(settings)
         sprites.bosses.empty()
         sprites.boss_bullets.empty()
 
 
-def check_ship_bosses_collision(settings: Settings,
-                                stats: Stats,
+def check_ship_bosses_collision(stats: Stats,
                                 hud: Hud,
                                 ship: Ship,
                                 sprites: Sprites) -> list | None:
     if collided := pygame.sprite.spritecollideany(ship, sprites.bosses):
-        common.ship_hit_on_boss_stage(settings=settings,
-                                      stats=stats,
+        common.ship_hit_on_boss_stage(stats=stats,
                                       hud=hud,
                                       ship=ship,
                                       sprites=sprites)
@@ -93,34 +98,39 @@ def check_ship_bullets_boss_shield_collision(sprites: Sprites) -> None:
 
 def check_ship_health_collision(stats: Stats, hud: Hud, ship: Ship, health: Group) -> None:
     if pygame.sprite.spritecollideany(ship, health):
-        effect = pygame.mixer.Sound(Paths.effects() / "pick_up_1.ogg")
-        effect.play()
+        Sounds().play("pick_up")
         health.empty()
         stats.ships_left += 1
-        hud.prep_health()
+        hud.invalidate()
 
 
 def check_ship_ammo_collision(stats: Stats, hud: Hud, ship: Ship, ammo: Group) -> None:
     if pygame.sprite.spritecollideany(ship, ammo):
         stats.ammo += 1
         ammo.empty()
-        hud.prep_ammo()
+        hud.invalidate()
 
 
-def check_ship_black_holes_collision(settings: Settings,
-                                     stats: Stats,
+def check_ship_black_holes_collision(stats: Stats,
                                      hud: Hud,
                                      ship: Ship,
                                      sprites: Sprites) -> list | None:
     if collided := pygame.sprite.spritecollideany(ship, sprites.boss_black_holes):
-        common.ship_hit_on_boss_stage(settings=settings,
-                                      stats=stats,
+        common.ship_hit_on_boss_stage(stats=stats,
                                       hud=hud,
                                       ship=ship,
                                       sprites=sprites)
     return collided
 
 
+def check_ship_shields_bullets_collision(shields: Group, bullets: EnemyBullets) -> None:
+    bullets.kill_colliding(shield.rect for shield in shields)
+
+
+def check_enemy_bullets_screen_collision(screen: Screen, bullets: EnemyBullets) -> None:
+    bullets.cull(screen.rect)
+
+
 def check_bullets_screen_collision(screen: Screen, bullets: Group[Bullet]) -> None:
     screen_rect = screen.rect
     for bullet in bullets:
@@ -1,43 +1,46 @@
-import secrets
 from itertools import chain
-from time import sleep
 from typing import TYPE_CHECKING
 
 import pygame
 
 from game.black_hole import BlackHole
-from game.boss_bullets import BlueBossBullet, GreenBossBullet, RedBossBullet
 from game.boss_shield import BlueBossShield, GreenBossShield, RedBossShield
 from game.bosses import BlueBoss, GreenBoss, RedBoss
 from game.bullet import Bullet
-from game.paths import Paths
 from game.rotation import rotate_to_up
+from game.scheduler import Scheduler
 from game.screen import ScreenSide
 from game.ship_consumables import ShipShield
+from game.sounds import Sounds
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pygame.rect import FRect, Rect
     from pygame.sprite import Group, GroupSingle
 
+    from game.boss_bullets import BossBullet
     from game.boss_shield import BossShield
     from game.bosses import Boss
     from game.button import Button
+    from game.enemy_bullets import EnemyBullets
     from game.hud import Hud
     from game.pause_menu import PauseMenu
+    from game.renderer import DirtyRenderer
     from game.screen import Screen
     from game.settings import Settings
     from game.ship import Ship
-    from game.sprites import Sprites
+    from game.sprites import Drawable, Sprites
     from game.stats import Stats
+    from game.timestep import Interpolation
 
 
-def initialize_game_from_main_menu(settings: Settings, stats: Stats, hud: Hud, ship: Ship) -> None:
-    settings.initialize_dynamic_settings()
+def initialize_game_from_main_menu(stats: Stats, hud: Hud, ship: Ship) -> None:
+    Scheduler().clear()
     pygame.mouse.set_visible(False)
     stats.reset_stats()
     ship.set_default_movement()
-    hud.prep_health()
-    hud.prep_ammo()
-    hud.prep_shield()
+    hud.invalidate()
     rotate_to_up(ship)
 
 
@@ -71,19 +74,10 @@ def handle_ship_diagonal_movement(ship: Ship) -> None:
             break
 
 
-def update_screen(settings: Settings,
-                  screen: Screen,
-                  hud: Hud,
-                  ship: Ship,
-                  sprites: Sprites,
-                  dt: int) -> None:
-    """Update screen."""
-    screen.it.fill(settings.bg_color)
-
-    for item in chain(
+def drawable_sprites(ship: Ship, sprites: Sprites) -> Iterator[Drawable]:
+    # Sprites in drawing order.
+    return chain(
         sprites.ship_bullets.sprites(),
-        sprites.alien_bullets.sprites(),
-        sprites.boss_bullets.sprites(),
         sprites.ship_shields.sprites(),
         sprites.ship_health.sprites(),
         sprites.ship_ammo.sprites(),
@@ -91,39 +85,53 @@ def update_screen(settings: Settings,
         sprites.bosses.sprites(),
         sprites.aliens.sprites(),
         (ship,),
-    ):
-        item.blitme()
+        sprites.boss_shields.sprites(),
+    )
+
+
+def update_screen(screen: Screen,
+                  hud: Hud,
+                  ship: Ship,
+                  sprites: Sprites,
+                  interpolation: Interpolation,
+                  renderer: DirtyRenderer,
+                  alpha: float) -> None:
+    """Update screen areas changed since previous frame."""
+    renderer.clear()
+
+    drawn: list[Rect | FRect] = [
+        *sprites.alien_bullets.draw(screen.it, alpha),
+        *sprites.boss_bullets.draw(screen.it, alpha),
+    ]
+    drawn.extend(item.blitme(interpolation.rect(item, alpha)) for item in drawable_sprites(ship, sprites))
+    drawn.extend(hud.show_hud())
+
+    renderer.present(drawn)
 
-    # Ship shield duration handling.
-    if sprites.ship_shields:
-        settings.time_elapsed_since_shield += dt
-        if settings.time_elapsed_since_shield > 3000:
-            settings.time_elapsed_since_shield = 0
-            sprites.ship_shields.empty()
 
-    # Display boss shield on hud.
+def update_boss_shield(sprites: Sprites) -> None:
     boss_shield: BossShield | None
     if boss_shield := sprites.boss_shields.sprite:
         if boss_shield.health_points > 0:
-            boss_shield.draw_boss_shield()
             boss_shield.update()
         else:
             sprites.boss_shields.empty()
 
-    hud.show_hud()
-
-    pygame.display.flip()
-
 
-def update_main_menu_screen(settings: Settings, screen: Screen, start_button: Button) -> None:
+def update_main_menu_screen(settings: Settings, screen: Screen, start_button: Button, *, redraw: bool) -> None:
+    """Draw main menu, when it is shown first or hover state of start button has changed."""
+    if not (start_button.update() or redraw):
+        return
     screen.it.fill(settings.bg_color)
     start_button.draw()
-    start_button.update()
     pygame.display.flip()
 
 
-def update_pause_screen(pause_menu: PauseMenu) -> None:
-    pause_menu.update()
+def update_pause_screen(pause_menu: PauseMenu, *, redraw: bool) -> None:
+    """Draw pause menu over the game, when it is shown first or hover state of its button has changed."""
+    if not (pause_menu.update() or redraw):
+        return
+    pause_menu.draw()
     pygame.display.flip()
 
 
@@ -143,17 +151,21 @@ def get_aliens_row_count(settings: Settings, alien_width: int) -> int:
     return int(available_space_x / (2 * alien_width))
 
 
+def hit_stop(settings: Settings) -> None:
+    """Freeze simulation for a moment without blocking, see run.simulate."""
+    Scheduler().freeze(settings.hit_stop_time)
+
+
 def ship_hit_on_regular_stage(settings: Settings,
                               stats: Stats,
                               hud: Hud,
                               ship: Ship,
                               sprites: Sprites) -> None:
     stats.ships_left -= 1
-    hud.prep_health()
+    hud.invalidate()
     sprites.ship_health.empty()
     sprites.ship_ammo.empty()
     sprites.ship_shields.empty()
-    settings.time_elapsed_since_shield = 0
 
     sprites.alien_bullets.empty()
     sprites.aliens.empty()
@@ -161,16 +173,15 @@ def ship_hit_on_regular_stage(settings: Settings,
     if stats.ships_left:
         ship.center_ship()
         rotate_to_up(ship)
-        sleep(settings.game_sleep_time)
+        hit_stop(settings)
 
 
-def ship_hit_on_boss_stage(settings: Settings,
-                           stats: Stats,
+def ship_hit_on_boss_stage(stats: Stats,
                            hud: Hud,
                            ship: Ship,
                            sprites: Sprites) -> None:
     stats.ships_left -= 1
-    hud.prep_health()
+    hud.invalidate()
 
     boss: Boss | None = sprites.bosses.sprite
     if boss is None:
@@ -182,29 +193,20 @@ def ship_hit_on_boss_stage(settings: Settings,
     sprites.bosses.empty()
     sprites.boss_bullets.empty()
     sprites.ship_shields.empty()
-    settings.time_elapsed_since_shield = 0
-    settings.time_elapsed_since_boss_shield = 0
     ship.prepare_for_boss()
 
 
-def fire_green_boss_bullets(settings: Settings,
-                            screen: Screen,
-                            boss: GreenBoss,
-                            boss_bullets: Group,
-                            dt: int) -> None:
-    """Create green boss bullets."""
-    settings.time_elapsed_since_last_boss_bullet += dt
-    if settings.time_elapsed_since_last_boss_bullet <= settings.green_boss_bullet_timer:
+def fire_boss_bullets(settings: Settings,
+                      ship: Ship,
+                      bosses: GroupSingle,
+                      boss_bullets: EnemyBullets,
+                      bullet: type[BossBullet]) -> None:
+    """Fire next volley of boss bullet pattern."""
+    boss: Boss | None
+    if not (boss := bosses.sprite):
         return
 
-    ranges = (range(180), range(90, 270), range(180, 360), range(270, 450))
-    for range_ in ranges:
-        bullet = GreenBossBullet(settings=settings, screen=screen, boss=boss)
-        bullet.shooting_angle_up = secrets.choice(range_)
-        boss_bullets.add(bullet)
-
-    settings.time_elapsed_since_last_boss_bullet = 0
-    settings.green_boss_bullet_timer = 1650
+    bullet.fire(settings=settings, bullets=boss_bullets, boss=boss, ship=ship)
 
 
 def use_ship_shield(screen: Screen,
@@ -214,12 +216,13 @@ def use_ship_shield(screen: Screen,
                     used_shields: Group) -> None:
     """Handle use of ship shield."""
     if stats.shields_left:
-        effect = pygame.mixer.Sound(Paths.effects() / "1.ogg")
-        effect.play()
+        Sounds().play("shield")
         used_shield = ShipShield(screen, ship)
         used_shields.add(used_shield)
+        # Shield lasts three seconds, unless ship is hit earlier.
+        Scheduler().once(3000, used_shield.kill)
         stats.shields_left -= 1
-        hud.prep_shield()
+        hud.invalidate()
 
 
 def create_blue_boss(screen: Screen, sprites: Sprites) -> None:
@@ -258,90 +261,20 @@ def create_red_boss(settings: Settings, screen: Screen, sprites: Sprites) -> Non
     sprites.boss_shields.add(boss_shield)
 
 
-def update_green_boss_bullets(boss_bullets: Group[GreenBossBullet]) -> None:
-    for green_boss_bullet in boss_bullets:
-        if green_boss_bullet.bounces > 3:
-            green_boss_bullet.kill()
-        else:
-            green_boss_bullet.change_direction()
-
-
-def fire_red_boss_bullets(settings: Settings,
-                          screen: Screen,
-                          ship: Ship,
-                          bosses: GroupSingle,
-                          boss_bullets: Group,
-                          dt: int) -> None:
-    """Create red boss bullets."""
-    settings.time_elapsed_since_last_red_boss_bullet += dt
-    if settings.time_elapsed_since_last_red_boss_bullet <= 1350:
-        return
-
-    boss: RedBoss | None
-    if not (boss := bosses.sprite):
-        return
-
-    for angle in (0, 15, 30, -15, -30):
-        bullet = RedBossBullet(settings, screen, boss)
-        bullet.define_position(ship)
-        bullet.shooting_angle += angle
-        boss_bullets.add(bullet)
-
-    settings.time_elapsed_since_last_red_boss_bullet = 0
-
+def update_green_boss_bullets(screen: Screen, boss_bullets: EnemyBullets) -> None:
+    boss_bullets.bounce(screen.rect)
 
-def fire_blue_boss_bullets(settings: Settings,
-                           screen: Screen,
-                           bosses: GroupSingle,
-                           boss_bullets: Group,
-                           dt: int) -> None:
-    """Create blue boss bullets."""
-    settings.time_elapsed_since_last_blue_boss_bullet += dt
-    if settings.time_elapsed_since_last_blue_boss_bullet <= 300:
-        return
 
-    boss: BlueBoss | None
-    if not (boss := bosses.sprite):
-        return
-
-    angles = (30, 120, 210, 300)
-    bullets = (BlueBossBullet(settings, screen, boss, boss.shooting_angle + angle) for angle in angles)
-    boss_bullets.add(bullets)
-
-    settings.time_elapsed_since_last_blue_boss_bullet = 0
-    if boss.rt_trigger:
-        boss.shooting_angle += 15
-        if boss.shooting_angle > 400:
-            boss.rt_trigger = False
-    else:
-        boss.shooting_angle -= 15
-        if boss.shooting_angle < 0:
-            boss.rt_trigger = True
-
-
-def maybe_create_black_hole(settings: Settings,
-                            screen: Screen,
-                            ship: Ship,
-                            black_holes: GroupSingle) -> None:
-    if not black_holes and settings.black_hole_spawn_timer > 2000:
+def create_black_hole(settings: Settings,
+                      screen: Screen,
+                      ship: Ship,
+                      black_holes: GroupSingle) -> None:
+    if not black_holes:
         black_holes.add(BlackHole(settings, screen, ship))
 
 
-def update_black_hole(settings: Settings, black_holes: GroupSingle, dt: int) -> None:
+def rotate_black_hole(black_holes: GroupSingle) -> None:
     """Update black hole animation."""
-    settings.black_hole_spawn_timer += dt
-    if black_holes and settings.black_hole_spawn_timer > 6000:
-        black_holes.empty()
-        settings.black_hole_spawn_timer = 0
-        return
-
     black_hole: BlackHole | None
-    if not (black_hole := black_holes.sprite):
-        return
-
-    settings.black_hole_rotation_timer += dt
-    if settings.black_hole_rotation_timer <= 300:
-        return
-
-    black_hole.update()
-    settings.black_hole_rotation_timer = 0
+    if black_hole := black_holes.sprite:
+        black_hole.update()
@@ -1,66 +1,23 @@
 import math
-from enum import Enum, auto
 from typing import TYPE_CHECKING
 
-from game import find_angle as fa
-
 if TYPE_CHECKING:
-    from game.alien_bullet import AlienBullet
-    from game.boss_bullets import RedBossBullet
-    from game.ship import Ship
-
-
-class ShipToBulletPosition(Enum):
-    UP_LEFT = auto()
-    UP_RIGHT = auto()
-    DOWN_LEFT = auto()
-    DOWN_RIGHT = auto()
-
-
-def define_direct_bullet_angle(bullet: AlienBullet | RedBossBullet, ship: Ship) -> None:
-    ab = abs(bullet.y - ship.centery)
-    ac = abs(bullet.x - ship.centerx)
-    bc = math.sqrt(pow(ab, 2) + pow(ac, 2))
-    bullet.shooting_angle_cos = ac / bc
-    bullet.shooting_angle = fa.find_angle_with_cos(bullet.shooting_angle_cos)
+    from collections.abc import Iterable
 
+    from game.ship import Ship
 
-def define_direct_bullet_position(bullet: AlienBullet | RedBossBullet, ship: Ship) -> None:
-    if (bullet.x < ship.centerx and bullet.y < ship.centery) or (
-        bullet.x < ship.centerx and bullet.y == ship.centery
-    ):
-        bullet.ship_position = ShipToBulletPosition.DOWN_RIGHT
-    elif (bullet.x < ship.centerx and bullet.y > ship.centery) or (
-        bullet.x == ship.centerx and bullet.y > ship.centery
-    ):
-        bullet.ship_position = ShipToBulletPosition.UP_RIGHT
-    elif (bullet.x > ship.centerx and bullet.y > ship.centery) or (
-        bullet.x > ship.centerx and bullet.y == ship.centery
-    ):
-        bullet.ship_position = ShipToBulletPosition.UP_LEFT
-    elif (bullet.x > ship.centerx and bullet.y < ship.centery) or (
-        bullet.x == ship.centerx and bullet.y < ship.centery
-    ):
-        bullet.ship_position = ShipToBulletPosition.DOWN_LEFT
-    else:
-        raise AssertionError
-    define_direct_bullet_angle(bullet=bullet, ship=ship)
 
+def aim(position: tuple[float, float], ship: Ship, speed: float) -> tuple[float, float]:
+    # Velocity from position to ship center.
+    dx = ship.rect.centerx - position[0]
+    dy = ship.rect.centery - position[1]
+    distance = math.hypot(dx, dy)
+    if not distance:
+        # Straight down, when bullet spawns right at the ship.
+        return 0.0, speed
+    return dx / distance * speed, dy / distance * speed
 
-def update_direct_bullet(bullet: AlienBullet | RedBossBullet) -> None:
-    match bullet.ship_position:
-        case ShipToBulletPosition.DOWN_RIGHT:
-            radians = math.radians(360 - bullet.shooting_angle)
-        case ShipToBulletPosition.UP_RIGHT:
-            radians = math.radians(bullet.shooting_angle)
-        case ShipToBulletPosition.UP_LEFT:
-            radians = math.radians(180 - bullet.shooting_angle)
-        case ShipToBulletPosition.DOWN_LEFT:
-            radians = math.radians(180 + bullet.shooting_angle)
 
-    bullet_move_x = bullet.speed * math.cos(radians)
-    bullet_move_y = -bullet.speed * math.sin(radians)
-    bullet.x += bullet_move_x
-    bullet.y += bullet_move_y
-    bullet.rect.centerx = bullet.x  # type: ignore[assignment]
-    bullet.rect.centery = bullet.y  # type: ignore[assignment]
+def aim_volley(positions: Iterable[tuple[float, float]], ship: Ship, speed: float) -> list[tuple[float, float]]:
+    # Velocities from every position to ship center.
+    return [aim(position, ship, speed) for position in positions]
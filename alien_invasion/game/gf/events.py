@@ -1,6 +1,5 @@
 import json
 import sys
-import time
 from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,7 +9,7 @@ import pygame
 from pygame.event import Event
 
 import game.rotation as rt
-from game.gf.common import fire_bullet, use_ship_shield
+from game.gf.common import fire_bullet, hit_stop, use_ship_shield
 from game.screen import ScreenSide
 from game.utils import Singleton
 
@@ -30,11 +29,13 @@ if TYPE_CHECKING:
 class MainMenuEvents:
     quit: bool = False
     play: bool = False
+    redraw: bool = False
 
     def update(self, events: MainMenuEvents) -> None:
         # Update once
         self.quit = self.quit or events.quit
         self.play = self.play or events.play
+        self.redraw = self.redraw or events.redraw
 
 
 @dataclass
@@ -42,12 +43,14 @@ class PauseEvents:
     quit: bool = False
     unpause: bool = False
     to_main_menu: bool = False
+    redraw: bool = False
 
     def update(self, events: PauseEvents) -> None:
         # Update once
         self.quit = self.quit or events.quit
         self.unpause = self.unpause or events.unpause
         self.to_main_menu = self.to_main_menu or events.to_main_menu
+        self.redraw = self.redraw or events.redraw
 
 
 @dataclass
@@ -191,12 +194,24 @@ def check_active_game_events(settings: Settings,
     return active_game_events
 
 
-def check_pause_events(ship: Ship, pause_menu: PauseMenu) -> PauseEvents:
+def wait_events(timeout: int) -> list[Event]:
+    # Block until input arrives or timeout in milliseconds passes, so idle menus do not spin.
+    if not timeout:
+        return pygame.event.get()
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event, *pygame.event.get()]
+
+
+def check_pause_events(ship: Ship, pause_menu: PauseMenu, timeout: int) -> PauseEvents:
     events = PauseEvents()
-    for event in pygame.event.get():
+    for event in wait_events(timeout):
         match event.type:
             case pygame.QUIT:
                 events.update(PauseEvents(quit=True))
+            case pygame.WINDOWEXPOSED:
+                events.update(PauseEvents(redraw=True))
             case pygame.KEYDOWN:
                 events.update(check_pause_keydown_events(event, ship))
             case pygame.KEYUP:
@@ -206,13 +221,15 @@ def check_pause_events(ship: Ship, pause_menu: PauseMenu) -> PauseEvents:
     return events
 
 
-def check_main_menu_events(play_button: Button) -> MainMenuEvents:
+def check_main_menu_events(play_button: Button, timeout: int) -> MainMenuEvents:
     main_menu_events = MainMenuEvents()
-    events = Events().get()
+    events = Events().get(timeout)
     for event in events:
         match event.type:
             case pygame.QUIT:
                 main_menu_events.update(MainMenuEvents(quit=True))
+            case pygame.WINDOWEXPOSED:
+                main_menu_events.update(MainMenuEvents(redraw=True))
             case pygame.MOUSEBUTTONDOWN:
                 main_menu_events.update(MainMenuEvents(play=check_play_button_pressed(play_button)))
             case pygame.KEYDOWN:
@@ -241,11 +258,14 @@ def quit_game() -> None:
 
 
 def end_game(settings: Settings, screen: Screen, stages: Stages) -> None:
-    # Hide ship fast
-    screen.it.fill(settings.bg_color)
     stages.current.teardown()
+    if screen.headless:
+        return
+
+    # Hide ship fast, main menu shows up after hit-stop
+    screen.it.fill(settings.bg_color)
     pygame.display.flip()
-    time.sleep(settings.game_sleep_time)
+    hit_stop(settings)
 
 
 class Events(metaclass=Singleton):
@@ -261,15 +281,27 @@ class Events(metaclass=Singleton):
     def record(self) -> bool:
         return bool(self.record_filepath)
 
-    def get(self) -> list[Event]:
+    def get(self, timeout: int = 0) -> list[Event]:
+        # Wait up to timeout in milliseconds for real input, recorded events are returned immediately.
         if not self.loaded:
-            return pygame.event.get()
+            return wait_events(timeout)
 
         try:
             return self.events.popleft()
         except IndexError:
             return []
 
+    def feed(self, events: list[Event]) -> None:
+        """Queue events for the next frame instead of real input."""
+        self.events.append(events)
+        self.loaded = True
+
+    def clear(self) -> None:
+        self.recorded_events.clear()
+        self.events.clear()
+        self.record_filepath = None
+        self.loaded = False
+
     def add(self, events: list[Event]) -> None:
         self.recorded_events.append([{"type": event.type, "dict": event.dict} for event in events])
 
@@ -1,10 +1,14 @@
 from typing import TYPE_CHECKING
 
-from pygame.sprite import Group
+import pygame
+from pygame import Surface
+from pygame.rect import Rect
 
 from game.ship_consumables import ShipAmmo, ShipHealth, ShipShield
 
 if TYPE_CHECKING:
+    from pygame.rect import FRect
+
     from game.screen import Screen
     from game.settings import Settings
     from game.ship import Ship
@@ -13,6 +17,12 @@ if TYPE_CHECKING:
 
 
 class Hud:
+    """Ship stats and boss health, composed into one cached layer.
+
+    Every area of hud, e.g. row of health icons, is a horizontal strip of layer. Layer is composed again only
+    when stats or boss health frame change and is drawn with one call, however many icons there are.
+
+    """
 
     def __init__(self,
                  settings: Settings,
@@ -27,41 +37,57 @@ class Hud:
         self.ship = ship
         self.boss_health = sprites.boss_health
 
-        # Preparing of hud.
-        self.prep_health()
-        self.prep_ammo()
-        self.prep_shield()
-
-    def prep_health(self) -> None:
-        """Prepare to drawn ship health."""
-        self.health: Group[ShipHealth] = Group()
-        for ship_number in range(self.stats.ships_left):
-            ship_health = ShipHealth(self.screen)
-            ship_health.rect.x = 20 + ship_number * (ship_health.rect.width + 10)
-            ship_health.rect.y = 28
-            self.health.add(ship_health)
-
-    def prep_ammo(self) -> None:
-        """Prepare to drawn ship ammo."""
-        self.ammo: Group[ShipAmmo] = Group()
-        for ammo in range(self.stats.ammo):
-            ship_ammo = ShipAmmo(self.screen)
-            ship_ammo.rect.x = 20 + ammo * (ship_ammo.rect.width + 10)
-            ship_ammo.rect.y = 60
-            self.ammo.add(ship_ammo)
-
-    def prep_shield(self) -> None:
-        """Prepare to drawn ship shield."""
-        self.shield: Group[ShipShield] = Group()
-        for _ in range(self.stats.shields_left):
-            stats_shield = ShipShield(self.screen, self.ship)
-            stats_shield.rect.x = 20
-            stats_shield.rect.y = 750
-            self.shield.add(stats_shield)
-
-    def show_hud(self) -> None:
-        """Draw hud on screen."""
-        self.health.draw(self.screen.it)
-        self.ammo.draw(self.screen.it)
-        self.shield.draw(self.screen.it)
-        self.boss_health.draw(self.screen.it)
+        # Layer with screen position and layer area of every hud area.
+        self.layer: Surface | None = None
+        self.blit_sequence: list[tuple[Surface, Rect, Rect]] = []
+        self.boss_frame: Surface | None = None
+
+    def invalidate(self) -> None:
+        """Compose hud again before next draw, e.g. after ship stats changed."""
+        self.layer = None
+
+    def areas(self) -> list[list[tuple[Surface, Rect]]]:
+        # Images with their screen positions grouped by hud area, empty areas are skipped.
+        health = ShipHealth.IMAGE
+        ammo = ShipAmmo.IMAGE
+        areas = [
+            [(health, health.get_rect(x=20 + number * (health.get_width() + 10), y=28))
+             for number in range(self.stats.ships_left)],
+            [(ammo, ammo.get_rect(x=20 + number * (ammo.get_width() + 10), y=60))
+             for number in range(self.stats.ammo)],
+        ]
+        if self.stats.shields_left:
+            areas.append([(ShipShield.IMAGE, ShipShield.IMAGE.get_rect(x=20, y=750))])
+        if (boss_health := self.boss_health.sprite) is not None:
+            areas.append([(boss_health.image, Rect(boss_health.rect))])
+        return [area for area in areas if area]
+
+    def compose(self) -> None:
+        areas = self.areas()
+        bounds = [area[0][1].unionall([rect for _, rect in area]) for area in areas]
+        self.layer = Surface((max((rect.width for rect in bounds), default=0), sum(rect.height for rect in bounds)),
+                             pygame.SRCALPHA).convert_alpha()
+        self.layer.fill((0, 0, 0, 0))
+        self.blit_sequence = []
+        top = 0
+        for area, bounds_rect in zip(areas, bounds, strict=True):
+            offset = (-bounds_rect.x, top - bounds_rect.y)
+            # Max blending with transparent layer copies pixels and alpha exactly, icons never overlap.
+            self.layer.fblits([(image, rect.move(offset)) for image, rect in area], pygame.BLEND_RGBA_MAX)
+            self.blit_sequence.append((self.layer, bounds_rect, Rect(0, top, bounds_rect.width, bounds_rect.height)))
+            top += bounds_rect.height
+
+    def show_hud(self) -> list[Rect | FRect]:
+        """Draw hud on screen.
+
+        Returns:
+            :return: Drawn areas.
+
+        """
+        boss_health = self.boss_health.sprite
+        if (boss_frame := boss_health.image if boss_health is not None else None) is not self.boss_frame:
+            self.boss_frame = boss_frame
+            self.invalidate()
+        if self.layer is None:
+            self.compose()
+        return list(self.screen.it.blits(self.blit_sequence) or [])
@@ -1,8 +1,30 @@
+import hashlib
+import json
+import mmap
+import tempfile
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
 import pygame
 from pygame import Surface
+from pygame.rect import Rect
 
 from game.paths import Paths
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = getLogger(__name__)
+
+# Width of texture atlas, small sprites are packed into rows of this width.
+ATLAS_WIDTH = 1024
+
+# Cache of decoded images, bump version when layout of cache file changes.
+CACHE_NAME = "images.cache"
+CACHE_VERSION = 1
+CACHE_FORMAT: Final = "BGRA"
+
 
 def load_image(relative_path: str) -> Surface:
     images = Paths.images()
@@ -17,3 +39,260 @@ def load_sequential_from_dirs(*directories: str) -> list[Surface]:
         images = (image for image in directory.glob("*.png"))
         result.extend(pygame.image.load(image) for image in sorted(images, key=lambda image: int(image.stem)))
     return result
+
+
+class Asset:
+    """Image file or directory of images, decoded on first use or when preloaded."""
+
+    def __init__(self, key: str, *, sequence: bool, atlas: bool) -> None:
+        self.key = key
+        self.sequence = sequence
+        # Small images drawn often are packed into texture atlas when preloaded together.
+        self.atlas = atlas
+        self.surfaces: list[Surface] = []
+        self.loaded = False
+        self.converted = False
+        self.packed = False
+        # Pixels and size of every surface in memory mapped image cache, see open_cache.
+        self.cached: list[tuple[memoryview, tuple[int, int]]] = []
+
+    def decode(self) -> None:
+        if self.cached:
+            # Cached pixels are already in display format and are shared, not copied.
+            self.surfaces = [pygame.image.frombuffer(pixels, size, CACHE_FORMAT) for pixels, size in self.cached]
+            self.converted = True
+        else:
+            self.surfaces = load_sequential_from_dirs(self.key) if self.sequence else [load_image(self.key)]
+        self.loaded = True
+
+    def paths(self) -> list[Path]:
+        # Source files of asset in the same order as decoded surfaces.
+        path = Paths.images() / self.key
+        if not self.sequence:
+            return [path]
+        return sorted(path.glob("*.png"), key=lambda image: int(image.stem))
+
+    @property
+    def size(self) -> int:
+        # Bytes of pixels held by surfaces, subsurfaces of atlas count only their own area.
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize() for surface in self.surfaces)
+
+    def evict(self) -> None:
+        # Drop surfaces, asset is decoded again on next use.
+        self.surfaces = []
+        self.loaded = self.converted = self.packed = False
+
+    def get(self) -> list[Surface]:
+        if not self.loaded:
+            self.decode()
+            if pygame.display.get_surface() is not None:
+                convert([self])
+        return self.surfaces
+
+
+# All assets known to the game by relative path, nothing is decoded on import.
+registry: dict[str, Asset] = {}
+
+
+def register(key: str, *, sequence: bool, atlas: bool) -> Asset:
+    # Class attributes referring to the same file share one asset.
+    if (asset := registry.get(key)) is None:
+        asset = registry[key] = Asset(key, sequence=sequence, atlas=atlas)
+    asset.atlas |= atlas
+    return asset
+
+
+class Image:
+    """Class attribute with single image from images directory."""
+
+    def __init__(self, relative_path: str, *, atlas: bool = False) -> None:
+        self.asset = register(relative_path, sequence=False, atlas=atlas)
+
+    def __get__(self, instance: object, owner: type | None = None) -> Surface:
+        return self.asset.get()[0]
+
+
+class ImageSequence:
+    """Class attribute with images loaded from directory, numbered from 1."""
+
+    def __init__(self, directory: str, *, atlas: bool = False) -> None:
+        self.asset = register(directory, sequence=True, atlas=atlas)
+
+    def __get__(self, instance: object, owner: type | None = None) -> list[Surface]:
+        return self.asset.get()
+
+
+def pack(surfaces: list[Surface], width: int) -> list[Rect]:
+    # Shelf packing: surfaces sorted by height are placed left to right in rows, return rect of each surface.
+    rects = [surface.get_rect() for surface in surfaces]
+    x = y = row_height = 0
+    for rect in sorted(rects, key=lambda rect: rect.height, reverse=True):
+        if x + rect.width > width:
+            x, y, row_height = 0, y + row_height, 0
+        rect.topleft = (x, y)
+        x += rect.width
+        row_height = max(row_height, rect.height)
+    return rects
+
+
+def build_atlas(surfaces: list[Surface], width: int = ATLAS_WIDTH) -> list[Surface]:
+    # Copy surfaces into one atlas surface and return subsurfaces of atlas in the same order.
+    rects = pack(surfaces, width)
+    atlas = Surface(Rect(0, 0, 0, 0).unionall(rects).size, pygame.SRCALPHA).convert_alpha()
+    atlas.fill((0, 0, 0, 0))
+    # Max blending with transparent atlas copies pixels and alpha exactly, unlike alpha blending.
+    atlas.fblits(zip(surfaces, rects, strict=True), pygame.BLEND_RGBA_MAX)
+    return [atlas.subsurface(rect) for rect in rects]
+
+
+def convert(assets: Iterable[Asset]) -> None:
+    # Convert to display pixel format, requires display mode to be set.
+    for asset in assets:
+        if asset.loaded and not asset.converted:
+            asset.surfaces[:] = [surface.convert_alpha() for surface in asset.surfaces]
+            asset.converted = True
+
+
+def load(keys: Iterable[str]) -> None:
+    """Preload assets by keys and convert them, when display exists.
+
+    Atlas assets among keys, which are not in atlas yet, are packed together into new atlas.
+
+    """
+    assets = [registry[key] for key in keys]
+    for asset in assets:
+        if not asset.loaded:
+            asset.decode()
+    if pygame.display.get_surface() is None:
+        return
+
+    convert(assets)
+    packed = [asset for asset in assets if asset.atlas and not asset.packed]
+    if not packed:
+        return
+    subsurfaces = iter(build_atlas([surface for asset in packed for surface in asset.surfaces]))
+    for asset in packed:
+        asset.surfaces[:] = [next(subsurfaces) for _ in asset.surfaces]
+        asset.packed = True
+
+
+def convert_images() -> None:
+    """Convert images decoded before display mode was set.
+
+    Blits of converted images skip per pixel format conversion.
+
+    """
+    convert(registry.values())
+
+
+def display_masks() -> tuple[int, int, int, int]:
+    # Color masks of display pixel format with per pixel alpha.
+    return Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+
+
+def cache_masks() -> tuple[int, int, int, int]:
+    # Color masks of surfaces created from cached pixels.
+    return pygame.image.frombuffer(bytes(4), (1, 1), CACHE_FORMAT).get_masks()
+
+
+def fingerprint() -> str:
+    # Hash of contents of all registered source images, cache is stale when any of them changes.
+    # Contents are hashed instead of modification times, because onefile build unpacks assets anew on every launch.
+    digest = hashlib.blake2b(f"{CACHE_VERSION}\n".encode())
+    for key in sorted(registry):
+        for path in registry[key].paths():
+            data = path.read_bytes()
+            digest.update(f"{key} {path.name} {len(data)}\n".encode())
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def write_cache(path: Path, digest: str) -> None:
+    """Decode and convert all registered images and store their pixels in cache file.
+
+    Cache file starts with JSON header line with offset and size of every surface, padded so pixels are aligned,
+    followed by pixels of all surfaces.
+
+    """
+    assets = list(registry.values())
+    decoded = [asset for asset in assets if not asset.loaded]
+    for asset in decoded:
+        asset.decode()
+    convert(assets)
+
+    pixels = bytearray()
+    entries: dict[str, list[tuple[int, int, int]]] = {}
+    for asset in assets:
+        entries[asset.key] = []
+        for surface in asset.surfaces:
+            entries[asset.key].append((len(pixels), *surface.get_size()))
+            pixels += pygame.image.tobytes(surface, CACHE_FORMAT)
+    header = json.dumps({"fingerprint": digest, "size": len(pixels), "assets": entries}).encode()
+    header += b" " * (-(len(header) + 1) % 64) + b"\n"
+
+    # Running game keeps old cache file mapped, so new one is written aside and moved over it.
+    # Temporary file has unique name, so processes starting at once never write into the same file.
+    temporary: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as file:
+            temporary = Path(file.name)
+            file.write(header)
+            file.write(pixels)
+        temporary.replace(path)
+    except OSError:
+        log.warning("Failed to write image cache %s", path, exc_info=True)
+        if temporary is not None:
+            temporary.unlink(missing_ok=True)
+
+    # Images decoded only to be written are decoded from cache again on first use.
+    for asset in decoded:
+        asset.evict()
+
+
+def read_cache(path: Path, digest: str) -> bool:
+    # Point assets to their pixels in memory mapped cache file, assets are decoded from them on first use.
+    # Return False, when cache is missing or stale.
+    try:
+        with path.open("rb") as file:
+            # Copy on write mapping: surfaces are writable, but changes never reach the file.
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return False
+
+    start = mapped.find(b"\n") + 1
+    try:
+        header = json.loads(mapped[:start])
+    except ValueError:
+        header = {}
+    if (header.get("fingerprint") != digest
+            or header.get("size") != len(mapped) - start
+            or not registry.keys() <= header["assets"].keys()):
+        mapped.close()
+        return False
+
+    view = memoryview(mapped)[start:]
+    for asset in registry.values():
+        asset.cached = [(view[offset:offset + width * height * 4], (width, height))
+                        for offset, width, height in header["assets"][asset.key]]
+    return True
+
+
+def open_cache(path: Path | None = None) -> None:
+    """Decode registered images from cache of decoded images, rebuild cache when source images have changed.
+
+    Surfaces share memory of mapped cache file, so images are neither decoded from PNG files nor copied on first use.
+    Requires display mode to be set, displays with other pixel format or without cache directory decode images as usual.
+
+    """
+    if display_masks() != cache_masks():
+        return
+    if path is None:
+        try:
+            path = Paths.caches() / CACHE_NAME
+        except OSError:
+            log.warning("Image cache directory is not available", exc_info=True)
+            return
+    digest = fingerprint()
+    if not read_cache(path, digest):
+        write_cache(path, digest)
+        read_cache(path, digest)
@@ -1,3 +1,4 @@
+import os
 import sys
 from functools import cache
 from pathlib import Path
@@ -25,6 +26,11 @@ class Paths:
     def effects() -> Path:
         return Paths.assets() / "effects"
 
+    @staticmethod
+    @cache
+    def fonts() -> Path:
+        return Paths.assets() / "fonts"
+
     @staticmethod
     @cache
     def math() -> Path:
@@ -41,3 +47,17 @@ class Paths:
         path = Path(__file__).resolve().parent.parent / "logs"
         path.mkdir(parents=True, exist_ok=True)
         return path
+
+    @staticmethod
+    @cache
+    def caches() -> Path:
+        # Per-user cache directory, so game never writes into its install or source tree.
+        if sys.platform == "win32":
+            base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+        elif sys.platform == "darwin":
+            base = Path.home() / "Library" / "Caches"
+        else:
+            base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        path = base / "alien_invasion"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
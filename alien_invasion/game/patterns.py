@@ -0,0 +1,89 @@
+import math
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, override
+
+from game import rng
+from game.gf import direct_bullet
+
+if TYPE_CHECKING:
+    from game.ship import Ship
+
+
+def direction(angle: float) -> tuple[float, float]:
+    # Unit direction for angle in degrees, counted counter-clockwise from screen right.
+    radians = math.radians(angle)
+    return math.cos(radians), -math.sin(radians)
+
+
+# Unit directions for whole degrees, patterns look them up instead of computing trigonometry on fire.
+DIRECTIONS = [direction(angle) for angle in range(360)]
+
+
+@dataclass(kw_only=True)
+class Pattern:
+    """Boss bullet pattern declared as data: volley of unit directions for every step of pattern."""
+
+    # Milliseconds between volleys and before the first one, which defaults to period.
+    period: float
+    delay: float | None = None
+    # Count of bounces from screen borders, bullet is removed on the last one, see EnemyBullets.bounce.
+    bounces: int = 0
+
+    @abstractmethod
+    def volley(self, step: int, origin: tuple[float, float], ship: Ship) -> list[tuple[float, float]]:
+        pass
+
+
+@dataclass(kw_only=True)
+class Spread(Pattern):
+    """Bullets aimed at ship, each turned by its angle in degrees."""
+
+    angles: tuple[int, ...]
+    turns: list[tuple[float, float]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Cos and sin of every angle, aimed direction is turned with them on fire.
+        self.turns = [(math.cos(math.radians(angle)), math.sin(math.radians(angle))) for angle in self.angles]
+
+    @override
+    def volley(self, step: int, origin: tuple[float, float], ship: Ship) -> list[tuple[float, float]]:
+        x, y = direct_bullet.aim(origin, ship, 1)
+        return [(x * cos - y * sin, x * sin + y * cos) for cos, sin in self.turns]
+
+
+@dataclass(kw_only=True)
+class Spiral(Pattern):
+    """Bullets at fixed angles, whole volley turns by step every time and back at limits of turn."""
+
+    angles: tuple[int, ...]
+    step: int
+    limits: tuple[int, int]
+    volleys: list[list[tuple[float, float]]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Turn goes up until it is past upper limit, then down until it is past lower one, every volley is precomputed.
+        low, high = self.limits
+        turns: list[int] = []
+        turn, step = low, self.step
+        while not turns or (turn, step) != (low, self.step):
+            turns.append(turn)
+            turn += step
+            if turn > high or turn < low:
+                step = -step
+        self.volleys = [[DIRECTIONS[(turn + angle) % 360] for angle in self.angles] for turn in turns]
+
+    @override
+    def volley(self, step: int, origin: tuple[float, float], ship: Ship) -> list[tuple[float, float]]:
+        return self.volleys[step % len(self.volleys)]
+
+
+@dataclass(kw_only=True)
+class Scatter(Pattern):
+    """One bullet at random whole angle from every range of angles in degrees."""
+
+    ranges: tuple[range, ...]
+
+    @override
+    def volley(self, step: int, origin: tuple[float, float], ship: Ship) -> list[tuple[float, float]]:
+        return [DIRECTIONS[rng.choice(range_) % 360] for range_ in self.ranges]
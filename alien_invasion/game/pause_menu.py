@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 import pygame
 
 from game.button import Button
+from game.fonts import load_font
 
 if TYPE_CHECKING:
     from game.screen import Screen
@@ -18,7 +19,7 @@ class PauseMenu:
         self.surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
         self.rect = self.surface.get_rect()
 
-        font = pygame.font.SysFont("tahoma", size=40)
+        font = load_font(40)
         self.text_surface = font.render("PAUSED", True, (255, 255, 255))  # ruff:ignore[boolean-positional-value-in-call]
         self.text_rect = self.text_surface.get_rect(midtop=(self.rect.centerx, 20))
         self.back_to_menu_button = Button(surface=self.surface,
@@ -27,17 +28,27 @@ class PauseMenu:
         self._offset_x = self.screen.rect.centerx - self.size // 2
         self._offset_y = self.screen.rect.centery - self.size // 2
 
+        # Static part of menu, composed once.
+        self.background = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        pygame.draw.rect(self.background, self.menu_color, self.rect, border_radius=self.radius)
+        self.background.blit(self.text_surface, self.text_rect)
+        self.compose()
+
     def get_mouse_position(self) -> tuple[int, int]:
         mouse_x, mouse_y = pygame.mouse.get_pos()
         return mouse_x - self._offset_x, mouse_y - self._offset_y
 
-    def update(self) -> None:
+    def compose(self) -> None:
         self.surface.fill((0, 0, 0, 0))
-
-        pygame.draw.rect(self.surface, self.menu_color, self.rect, border_radius=self.radius)
-        self.surface.blit(self.text_surface, self.text_rect)
-
-        self.back_to_menu_button.update(mouse_position=self.get_mouse_position())
+        self.surface.blit(self.background, (0, 0))
         self.back_to_menu_button.draw()
 
+    def update(self) -> bool:
+        # Update hover state of menu button, return True, when menu has changed.
+        if not self.back_to_menu_button.update(mouse_position=self.get_mouse_position()):
+            return False
+        self.compose()
+        return True
+
+    def draw(self) -> None:
         self.screen.it.blit(self.surface, (self._offset_x, self._offset_y))
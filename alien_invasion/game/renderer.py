@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from pygame.rect import FRect, Rect
+
+    from game.screen import Screen
+
+
+class DirtyRenderer:
+    """Clear and present only screen areas drawn in previous or current frame.
+
+    Everything outside of areas drawn in previous frame is background, so there is no need to fill and flip
+    whole screen: previous areas are cleared, sprites are drawn and both old and new areas are pushed to display.
+
+    """
+
+    def __init__(self, screen: Screen, background: tuple[int, int, int]) -> None:
+        self.screen = screen
+        self.background = background
+        self.drawn: list[Rect | FRect] = []
+        self.full = True
+
+    def invalidate(self) -> None:
+        """Redraw whole screen on next frame, e.g. after menu was drawn over the game."""
+        self.full = True
+
+    def clear(self) -> None:
+        if self.full:
+            self.screen.it.fill(self.background)
+            return
+
+        for rect in self.drawn:
+            self.screen.it.fill(self.background, rect)
+
+    def present(self, drawn: list[Rect | FRect]) -> None:
+        if self.full:
+            pygame.display.flip()
+            self.full = False
+        else:
+            pygame.display.update(self.drawn + drawn)
+        self.drawn = drawn
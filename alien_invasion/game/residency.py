@@ -0,0 +1,58 @@
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from game import images
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = getLogger(__name__)
+
+
+class Residency:
+    """Images of stages kept in memory.
+
+    Images of active stages, i.e. current stage and stage after it, are preloaded and never evicted.
+    Images of other stages stay in memory while total size fits into budget, least recently used are evicted first.
+    Images not tagged by any stage, e.g. of menu, are left alone.
+    Small sprites packed into atlas are never evicted, because atlas is shared with images of other stages.
+    Large images, e.g. frame sequences of boss health, are not packed, so they are evicted as a whole.
+
+    """
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.stages: dict[str, tuple[str, ...]] = {}
+        # Tagged keys from least to most recently used.
+        self.used: dict[str, None] = {}
+        self.active: set[str] = set()
+
+    def tag(self, stage: str, keys: Iterable[str]) -> None:
+        self.stages[stage] = tuple(keys)
+
+    def activate(self, *stages: str) -> None:
+        """Preload images of given stages and evict images of other stages over budget."""
+        self.active = {key for stage in stages for key in self.stages[stage]}
+        for stage in stages:
+            images.load(self.stages[stage])
+            for key in self.stages[stage]:
+                self.used.pop(key, None)
+                self.used[key] = None
+        self.evict()
+
+    def evict(self) -> None:
+        resident = sum(images.registry[key].size for key in self.used)
+        for key in list(self.used):
+            if resident <= self.budget:
+                break
+            asset = images.registry[key]
+            if key in self.active or asset.atlas:
+                continue
+            resident -= asset.size
+            asset.evict()
+            del self.used[key]
+            log.debug("Evicted %s", key)
+
+    def report(self) -> dict[str, int]:
+        # Resident bytes of images of every stage, images shared by stages are counted for each of them.
+        return {stage: sum(images.registry[key].size for key in keys) for stage, keys in self.stages.items()}
@@ -0,0 +1,20 @@
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Gameplay randomness, not security sensitive. Seed it to reproduce a run.
+_generator = random.Random()  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+
+
+def seed(value: int | None) -> None:
+    _generator.seed(value)
+
+
+def choice[T](sequence: Sequence[T]) -> T:
+    return _generator.choice(sequence)
+
+
+def randrange(stop: int) -> int:
+    return _generator.randrange(stop)
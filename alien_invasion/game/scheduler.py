@@ -0,0 +1,96 @@
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from game.utils import Singleton
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@dataclass(order=True)
+class Timer:
+    """Callback due at given game time in milliseconds, repeated every period, when period is set."""
+
+    due: float
+    sequence: int
+    callback: Callable[[], None] = field(compare=False)
+    period: float | None = field(default=None, compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class Scheduler(metaclass=Singleton):
+    """Game time timers in heap ordered by due time.
+
+    Time advances with simulation, so timers neither run during pause nor during hit-stop.
+    Stages register their timers in setup and cancel them in teardown.
+
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.timers: list[Timer] = []
+        # Timers with equal due time run in order of registration.
+        self.sequence = itertools.count()
+        # Remaining time of current hit-stop.
+        self.freeze_time = 0.0
+
+    def once(self, delay: float, callback: Callable[[], None]) -> Timer:
+        # Run callback once after delay in milliseconds.
+        timer = Timer(due=self.now + delay, sequence=next(self.sequence), callback=callback)
+        heapq.heappush(self.timers, timer)
+        return timer
+
+    def every(self, period: float, callback: Callable[[], None], delay: float | None = None) -> Timer:
+        # Run callback every period in milliseconds, first time after delay, which defaults to period.
+        timer = Timer(due=self.now + (period if delay is None else delay),
+                      sequence=next(self.sequence),
+                      callback=callback,
+                      period=period)
+        heapq.heappush(self.timers, timer)
+        return timer
+
+    def freeze(self, duration: float) -> None:
+        """Suspend game time for duration in milliseconds, see run.simulate."""
+        self.freeze_time = duration
+
+    @property
+    def frozen(self) -> bool:
+        return self.freeze_time > 0
+
+    def next_due(self) -> float | None:
+        # Milliseconds until hit-stop is over or next timer is due, None when nothing is pending.
+        while self.timers and self.timers[0].cancelled:
+            heapq.heappop(self.timers)
+        if self.frozen:
+            return self.freeze_time
+        if not self.timers:
+            return None
+        return max(self.timers[0].due - self.now, 0)
+
+    def advance(self, dt: float) -> bool:
+        # Advance game time by dt and run due timers. Return False, when game time is frozen.
+        if self.frozen:
+            self.freeze_time -= dt
+            return False
+
+        self.now += dt
+        while self.timers and self.timers[0].due <= self.now:
+            timer = heapq.heappop(self.timers)
+            if timer.cancelled:
+                continue
+            if timer.period is not None:
+                timer.due += timer.period
+                heapq.heappush(self.timers, timer)
+            timer.callback()
+        return True
+
+    def clear(self) -> None:
+        """Drop all timers and hit-stop, e.g. when new game starts."""
+        self.now = 0.0
+        self.timers.clear()
+        self.freeze_time = 0.0
@@ -2,6 +2,8 @@ from enum import Enum, auto
 
 import pygame
 
+from game.images import convert_images, open_cache
+
 
 class ScreenSide(Enum):
     TOP = auto()
@@ -17,6 +19,12 @@ class ScreenSide(Enum):
 
 class Screen:
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, *, headless: bool = False) -> None:
+        # Headless screen lives on dummy video driver and is never drawn.
+        self.headless = headless
         self.it = pygame.display.set_mode((width, height))
         self.rect = self.it.get_rect()
+        if not headless:
+            # Headless runs never draw, so their images are decoded only when used.
+            open_cache()
+        convert_images()
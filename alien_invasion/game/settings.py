@@ -6,16 +6,14 @@ class Settings:
         self.screen_height = 800
         self.bg_color = (230, 230, 230)
 
-        # Ship settings.
+        # Ship settings. Speeds are measured in pixels per millisecond.
         self.bullets_allowed = 1
         self.ships_limit = health or 3
         self.ship_speed = 0.60
         self.bullet_speed_factor = 1.5
         self.shields_allowed = 1
-        self.time_elapsed_since_shield = 0
 
         # Aliens settings.
-        self.time_elapsed_since_last_alien_bullet = 0
         self.aliens_speed = 0.1
         self.alien_bullets_speed = 0.20
 
@@ -24,20 +22,17 @@ class Settings:
         self.green_boss_bullets_speed = 0.15
         self.red_boss_bullets_speed = 0.10
         self.blue_boss_bullets_speed = 0.3
-        self.time_elapsed_since_last_boss_bullet = 0
-        self.time_elapsed_since_boss_shield = 0
-        self.time_elapsed_since_last_red_boss_bullet = 0
-        self.time_elapsed_since_last_blue_boss_bullet = 0
-        self.green_boss_bullet_timer = 300
 
         # Game settings
-        self.framerate = 5000
-        self.game_sleep_time = 0.3
-
-        # Settings initialization.
-        self.initialize_dynamic_settings()
-
-    def initialize_dynamic_settings(self) -> None:
-        """Initialize settings, that change during the game."""
-        self.black_hole_spawn_timer = 0
-        self.black_hole_rotation_timer = 0
+        self.framerate = 144
+        self.simulation_rate = 240
+        self.max_frame_time = 250
+        # Hit-stop in milliseconds: simulation is suspended, while events and rendering go on.
+        self.hit_stop_time = 300
+        # Menus wait for input up to this many milliseconds instead of redrawing in busy loop.
+        self.menu_wait_timeout = 250
+        # Cell size of collision grid, about twice the alien size.
+        self.collision_cell_size = 128
+        # Bytes of decoded images kept in memory for stages other than current and next one, which are always kept.
+        # Fits images of regular stages, but not of bosses.
+        self.image_budget = 256 * 1024
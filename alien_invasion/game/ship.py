@@ -2,12 +2,12 @@ from typing import TYPE_CHECKING
 
 from pygame.sprite import Sprite
 
-from game.images import load_image
+from game.images import Image
 from game.rotation import rotate_to_up
 from game.screen import ScreenSide
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
+    from pygame.rect import FRect, Rect
     from pygame.surface import Surface
 
     from game.screen import Screen
@@ -17,14 +17,14 @@ if TYPE_CHECKING:
 class Ship(Sprite):
 
     class Images:
-        UP = load_image("ship_up.png")
-        RIGHT = load_image("ship_right.png")
-        LEFT = load_image("ship_left.png")
-        DOWN = load_image("ship_down.png")
-        UP_RIGHT = load_image("ship_up_right.png")
-        UP_LEFT = load_image("ship_up_left.png")
-        DOWN_RIGHT = load_image("ship_down_right.png")
-        DOWN_LEFT = load_image("ship_down_left.png")
+        UP = Image("ship_up.png", atlas=True)
+        RIGHT = Image("ship_right.png", atlas=True)
+        LEFT = Image("ship_left.png", atlas=True)
+        DOWN = Image("ship_down.png", atlas=True)
+        UP_RIGHT = Image("ship_up_right.png", atlas=True)
+        UP_LEFT = Image("ship_up_left.png", atlas=True)
+        DOWN_RIGHT = Image("ship_down_right.png", atlas=True)
+        DOWN_LEFT = Image("ship_down_left.png", atlas=True)
 
     def __init__(self, settings: Settings, screen: Screen) -> None:
         super().__init__()
@@ -33,50 +33,44 @@ class Ship(Sprite):
 
         self.image: Surface = self.Images.UP
 
-        # Get the rectangular area of the image.
-        self.rect: Rect = self.image.get_rect()
-
         self.screen_rect = screen.rect
 
-        # Set starting position of ship at the center of screen.
-        self.rect.centerx = self.screen_rect.centerx
-        self.rect.centery = self.screen_rect.centery
-
-        # Current ship position.
-        self.centerx = self.rect.centerx
-        self.centery = self.rect.centery
+        # Ship position, starting at the center of screen.
+        self.rect: FRect = self.image.get_frect(center=self.screen_rect.center)
 
         self.speed = self.settings.ship_speed
 
         self.set_default_movement()
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         """Update ship position depending on movement flag."""
+        distance = self.speed * dt
         if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.centerx += self.speed  # type: ignore[assignment]
+            self.rect.centerx += distance
         if self.moving_left and self.rect.left > 0:
-            self.centerx -= self.speed  # type: ignore[assignment]
+            self.rect.centerx -= distance
         if self.moving_up and self.rect.top > self.screen_rect.top:
-            self.centery -= self.speed  # type: ignore[assignment]
+            self.rect.centery -= distance
         if self.moving_down and self.rect.bottom < self.screen_rect.bottom:
-            self.centery += self.speed  # type: ignore[assignment]
-        self.rect.centerx = self.centerx
-        self.rect.centery = self.centery
+            self.rect.centery += distance
 
     def center_ship(self) -> None:
         """Set ship position on center of the screen."""
-        self.centerx = self.screen_rect.centerx
-        self.centery = self.screen_rect.centery
+        self.rect.center = self.screen_rect.center
 
     def prepare_for_boss(self) -> None:
         """Set ship position below boss position."""
-        self.centerx = self.screen_rect.centerx
-        self.centery = 700
+        self.rect.center = (self.screen_rect.centerx, 700)
         rotate_to_up(ship=self)
 
-    def blitme(self) -> None:
-        """Draw ship."""
-        self.screen.it.blit(self.image, self.rect)
+    def blitme(self, rect: Rect | FRect) -> Rect:
+        """Draw ship.
+
+        Returns:
+            :return: Drawn area.
+
+        """
+        return self.screen.it.blit(self.image, rect)
 
     def set_default_movement(self) -> None:
         # Flags to check if ship moving in one or another direction.
@@ -2,16 +2,28 @@ from typing import TYPE_CHECKING
 
 from pygame.sprite import Sprite
 
-from game.images import load_image
+from game.images import Image
 from game.screen import ScreenSide
 
 if TYPE_CHECKING:
-    from pygame.rect import Rect
+    from pygame.rect import FRect, Rect
     from pygame.surface import Surface
 
     from game.screen import Screen
     from game.ship import Ship
 
+# Offset of used shield from ship center for every ship rotation.
+SHIELD_OFFSETS: dict[ScreenSide, tuple[float, float]] = {
+    ScreenSide.TOP: (0, 0),
+    ScreenSide.BOTTOM: (0, 0),
+    ScreenSide.LEFT: (-8, 3),
+    ScreenSide.RIGHT: (-8, 3),
+    ScreenSide.TOP_LEFT: (-9, -5),
+    ScreenSide.TOP_RIGHT: (0, -5),
+    ScreenSide.BOTTOM_LEFT: (-9, 2),
+    ScreenSide.BOTTOM_RIGHT: (-1, 2),
+}
+
 
 class ShipConsumable(Sprite):
 
@@ -19,21 +31,27 @@ class ShipConsumable(Sprite):
                  screen: Screen,
                  image: Surface,
                  item: Surface,
-                 rect: Rect) -> None:
+                 rect: Rect | FRect) -> None:
         super().__init__()
         self.screen = screen
         self.image = image
         self.item = item
-        self.rect: Rect = rect
+        self.rect: Rect | FRect = rect
+
+    def blitme(self, rect: Rect | FRect) -> Rect:
+        """Draw item on screen.
 
-    def blitme(self) -> None:
-        """Draw item on screen."""
-        self.screen.it.blit(self.item, self.rect)
+        Returns:
+            :return: Drawn area.
+
+        """
+        return self.screen.it.blit(self.item, rect)
 
 
 class ShipHealth(ShipConsumable):
-    IMAGE = load_image("stats_health.png")
-    ITEM = load_image("spawned_health.png")
+    IMAGE = Image("stats_health.png", atlas=True)
+    ITEM = Image("spawned_health.png", atlas=True)
+    rect: Rect
 
     def __init__(self, screen: Screen) -> None:
         rect: Rect = self.IMAGE.get_rect()
@@ -41,8 +59,9 @@ class ShipHealth(ShipConsumable):
 
 
 class ShipAmmo(ShipConsumable):
-    IMAGE = load_image("stats_ammo.png")
-    ITEM = load_image("spawned_ammo.png")
+    IMAGE = Image("stats_ammo.png", atlas=True)
+    ITEM = Image("spawned_ammo.png", atlas=True)
+    rect: Rect
 
     def __init__(self, screen: Screen) -> None:
         rect: Rect = self.IMAGE.get_rect()
@@ -50,49 +69,16 @@ class ShipAmmo(ShipConsumable):
 
 
 class ShipShield(ShipConsumable):
-    IMAGE = load_image("stats_shield.png")
-    ITEM = load_image("spawned_shield.png")
+    IMAGE = Image("stats_shield.png", atlas=True)
+    ITEM = Image("spawned_shield.png", atlas=True)
+    rect: FRect
 
     def __init__(self, screen: Screen, ship: Ship) -> None:
-        rect: Rect = self.ITEM.get_rect()
+        rect: FRect = self.ITEM.get_frect(center=ship.rect.center)
         super().__init__(screen=screen, image=self.IMAGE, item=self.ITEM, rect=rect)
         self.ship = ship
 
-        self.rect.centerx = self.ship.centerx
-        self.rect.centery = self.ship.centery
-        self.centerx = self.rect.centerx
-        self.centery = self.rect.centery
-
     def update(self) -> None:
         """Update position of used shield relatively ship position."""
-        match self.ship.current_ship_rotation:
-            case ScreenSide.TOP | ScreenSide.BOTTOM:
-                self.centerx = self.ship.centerx
-                self.rect.centerx = self.centerx
-                self.centery = self.ship.centery
-                self.rect.centery = self.centery
-            case ScreenSide.LEFT | ScreenSide.RIGHT:
-                self.centerx = self.ship.centerx - 8
-                self.rect.centerx = self.centerx
-                self.centery = self.ship.centery + 3
-                self.rect.centery = self.centery
-            case ScreenSide.TOP_LEFT:
-                self.centerx = self.ship.centerx - 9
-                self.rect.centerx = self.centerx
-                self.centery = self.ship.centery - 5
-                self.rect.centery = self.centery
-            case ScreenSide.TOP_RIGHT:
-                self.centerx = self.ship.centerx
-                self.rect.centerx = self.centerx
-                self.centery = self.ship.centery - 5
-                self.rect.centery = self.centery
-            case ScreenSide.BOTTOM_LEFT:
-                self.centerx = self.ship.centerx - 9
-                self.rect.centerx = self.centerx
-                self.centery = self.ship.centery + 1
-                self.rect.centery = self.centery + 1
-            case ScreenSide.BOTTOM_RIGHT:
-                self.centerx = self.ship.centerx - 1
-                self.rect.centerx = self.centerx
-                self.centery = self.ship.centery + 2
-                self.rect.centery = self.centery
+        offset_x, offset_y = SHIELD_OFFSETS[self.ship.current_ship_rotation]
+        self.rect.center = (self.ship.rect.centerx + offset_x, self.ship.rect.centery + offset_y)
@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING, ClassVar
+
+import pygame
+
+from game.paths import Paths
+from game.utils import Singleton
+
+if TYPE_CHECKING:
+    from pygame.mixer import Channel, Sound
+
+# Mixer buffer in samples, smaller buffer lowers latency of effects, but may crackle on slow machines.
+AUDIO_BUFFER = 2048
+LOW_LATENCY_AUDIO_BUFFER = 512
+
+
+class Sounds(metaclass=Singleton):
+    """Sound effects decoded once on startup, every effect plays on its own reserved channel.
+
+    Reserved channels are never taken by other sounds, so effect always plays immediately,
+    replaying effect restarts it on its channel.
+
+    """
+
+    EFFECTS: ClassVar[dict[str, str]] = {
+        "shield": "1.ogg",
+        "pick_up": "pick_up_1.ogg",
+    }
+
+    def __init__(self) -> None:
+        self.sounds: dict[str, Sound] = {}
+        self.channels: dict[str, Channel] = {}
+
+    def load(self) -> None:
+        """Decode all effects and reserve their channels, requires mixer to be initialized."""
+        pygame.mixer.set_reserved(len(self.EFFECTS))
+        for index, (name, filename) in enumerate(self.EFFECTS.items()):
+            self.sounds[name] = pygame.mixer.Sound(Paths.effects() / filename)
+            self.channels[name] = pygame.mixer.Channel(index)
+
+    def play(self, name: str) -> None:
+        if not self.sounds:
+            self.load()
+        self.channels[name].play(self.sounds[name])
@@ -0,0 +1,49 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pygame.rect import FRect, Rect
+    from pygame.sprite import Sprite
+
+
+class SpatialHash:
+    """Uniform grid of sprites used as collision broadphase.
+
+    Grid is rebuilt once per simulation step, queries only test sprites from cells overlapped by query rect.
+    Sprites killed after rebuild are skipped, so grid stays valid while collisions remove sprites.
+
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size = cell_size
+        self.cells: defaultdict[tuple[int, int], list[Sprite]] = defaultdict(list)
+
+    def keys(self, rect: Rect | FRect) -> Iterator[tuple[int, int]]:
+        size = self.cell_size
+        for x in range(int(rect.left // size), int((rect.right - 1) // size) + 1):
+            for y in range(int(rect.top // size), int((rect.bottom - 1) // size) + 1):
+                yield x, y
+
+    def rebuild(self, sprites: Iterable[Sprite]) -> None:
+        self.cells.clear()
+        for sprite in sprites:
+            for key in self.keys(sprite.rect):  # type: ignore[arg-type]
+                self.cells[key].append(sprite)
+
+    def collide(self, rect: Rect | FRect) -> list[Sprite]:
+        # Alive sprites colliding with rect, sprite spanning several cells is returned once.
+        found: dict[Sprite, None] = {}
+        for key in self.keys(rect):
+            for sprite in self.cells.get(key, ()):
+                if sprite not in found and sprite.alive() and rect.colliderect(sprite.rect):  # type: ignore[arg-type]
+                    found[sprite] = None
+        return list(found)
+
+    def collideany(self, rect: Rect | FRect) -> Sprite | None:
+        for key in self.keys(rect):
+            for sprite in self.cells.get(key, ()):
+                if sprite.alive() and rect.colliderect(sprite.rect):  # type: ignore[arg-type]
+                    return sprite
+        return None
@@ -0,0 +1,35 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+from game import rng
+
+
+class SpawnRange:
+    """Integers from start to stop without banned ranges.
+
+    Only allowed intervals are stored, so sampling does not depend on range length or on count of banned values.
+
+    """
+
+    def __init__(self, start: int, stop: int, *banned: range) -> None:
+        self.intervals: list[range] = []
+        for ban in sorted((ban for ban in banned if ban), key=lambda ban: ban.start):
+            if ban.start > start:
+                self.intervals.append(range(start, min(ban.start, stop)))
+            start = max(start, ban.stop)
+            if start >= stop:
+                break
+        if start < stop:
+            self.intervals.append(range(start, stop))
+        self.intervals = [interval for interval in self.intervals if interval]
+        self.ends = list(accumulate(len(interval) for interval in self.intervals))
+
+    def __len__(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    def choice(self) -> int:
+        # Same pick as rng.choice from list of all allowed integers in ascending order.
+        index = rng.randrange(len(self))
+        position = bisect_right(self.ends, index)
+        interval = self.intervals[position]
+        return interval[index - self.ends[position] + len(interval)]
@@ -1,14 +1,28 @@
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Protocol
 
 from pygame.sprite import Group, GroupSingle
 
+from game.enemy_bullets import EnemyBullets
+from game.fleet import Fleet
+
+if TYPE_CHECKING:
+    from pygame.rect import FRect, Rect
+
+
+class Drawable(Protocol):
+    @property
+    def rect(self) -> Rect | FRect: ...
+
+    def blitme(self, rect: Rect | FRect) -> Rect: ...
+
 
 @dataclass
 class Sprites:
-    aliens: Group = field(default_factory=Group)
-    alien_bullets: Group = field(default_factory=Group)
+    aliens: Fleet = field(default_factory=Fleet)
+    alien_bullets: EnemyBullets = field(default_factory=EnemyBullets)
     bosses: GroupSingle = field(default_factory=GroupSingle)
-    boss_bullets: Group = field(default_factory=Group)
+    boss_bullets: EnemyBullets = field(default_factory=EnemyBullets)
     boss_shields: GroupSingle = field(default_factory=GroupSingle)
     boss_health: GroupSingle = field(default_factory=GroupSingle)
     boss_black_holes: GroupSingle = field(default_factory=GroupSingle)
@@ -1,26 +1,30 @@
-import secrets
-import time
 from abc import abstractmethod
 from collections import UserList
-from itertools import count
+from functools import partial
 from logging import getLogger
-from typing import TYPE_CHECKING, TypeAlias, Union
-
-import pygame
+from typing import TYPE_CHECKING, ClassVar, TypeAlias, Union
 
 import game.rotation as rt
-from game.alien import Alien, BlueAlien, RedAlien
+from game import images, rng
+from game.alien import Alien, BlueAlien, RedAlien, merge_fleet
 from game.alien_bullet import AlienBullet, BlueAlienBullet, RedAlienBullet
+from game.boss_bullets import BlueBossBullet, GreenBossBullet, RedBossBullet
 from game.gf import collision, common
+from game.residency import Residency
+from game.scheduler import Scheduler
 from game.ship_consumables import ShipAmmo, ShipHealth
+from game.spatial_hash import SpatialHash
+from game.spawn import SpawnRange
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
     from pygame.sprite import Group
 
+    from game.boss_bullets import BossBullet
     from game.bosses import Boss
     from game.hud import Hud
+    from game.scheduler import Timer
     from game.screen import Screen
     from game.settings import Settings
     from game.ship import Ship
@@ -33,15 +37,32 @@ log = getLogger(__name__)
 
 
 class BaseStage:
-
-    counter = count(start=0)
-
-    def __init__(self, screen: Screen, sprites: Sprites, name: str) -> None:
+    # Images preloaded on setup, anything else is decoded on first use.
+    IMAGES: ClassVar[tuple[str, ...]] = (
+        "ship_up.png",
+        "ship_right.png",
+        "ship_left.png",
+        "ship_down.png",
+        "ship_up_right.png",
+        "ship_up_left.png",
+        "ship_down_right.png",
+        "ship_down_left.png",
+        "bullet.png",
+        "stats_health.png",
+        "stats_ammo.png",
+        "stats_shield.png",
+        "spawned_health.png",
+        "spawned_ammo.png",
+        "spawned_shield.png",
+    )
+
+    def __init__(self, settings: Settings, screen: Screen, sprites: Sprites, name: str) -> None:
+        self.settings = settings
         self.screen = screen
         self.sprites = sprites
         self.name = name
-
-        self.index = next(self.counter)
+        # Timers registered in schedule, cancelled in teardown.
+        self.timers: list[Timer] = []
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name})"
@@ -57,6 +78,21 @@ class BaseStage:
     @abstractmethod
     def setup(self) -> None:
         log.debug("%s: setup()", self)
+        images.load(self.IMAGES)
+        self.schedule()
+
+    def schedule(self) -> None:
+        """Register timers of stage, e.g. enemy fire."""
+
+    def reschedule(self) -> None:
+        """Start timers of stage anew, e.g. after ship was hit."""
+        self.cancel_timers()
+        self.schedule()
+
+    def cancel_timers(self) -> None:
+        for timer in self.timers:
+            timer.cancel()
+        self.timers.clear()
 
     @abstractmethod
     def transit(self) -> None:
@@ -68,17 +104,18 @@ class BaseStage:
                                                  bullets=self.sprites.ship_bullets)
 
     @abstractmethod
-    def gameplay(self, dt: int) -> None:
+    def gameplay(self) -> None:
         pass
 
     @abstractmethod
-    def update(self) -> None:
-        self.sprites.ship_bullets.update()
+    def update(self, dt: float) -> None:
+        self.sprites.ship_bullets.update(dt)
         self.sprites.ship_shields.update()
 
     @abstractmethod
     def teardown(self) -> None:
         log.debug("%s: teardown()", self)
+        self.cancel_timers()
         self.sprites.ship_bullets.empty()
         self.sprites.ship_health.empty()
         self.sprites.ship_ammo.empty()
@@ -86,6 +123,8 @@ class BaseStage:
 
 
 class Stage(BaseStage):
+    IMAGES = (*BaseStage.IMAGES, "aliens/green_alien.png", "aliens/green_alien_bullet.png")
+    BULLET: type[AlienBullet] = AlienBullet
 
     def __init__(self,
                  stages: Stages,
@@ -96,25 +135,19 @@ class Stage(BaseStage):
                  ship: Ship,
                  sprites: Sprites,
                  name: str) -> None:
-        super().__init__(screen=screen, sprites=sprites, name=name)
+        super().__init__(settings=settings, screen=screen, sprites=sprites, name=name)
         self.stages = stages
-        self.settings = settings
         self.hud = hud
         self.stats = stats
         self.ship = ship
+        self.aliens_grid = SpatialHash(cell_size=settings.collision_cell_size)
 
-    def create_bullets(self) -> Generator[AlienBullet]:
-        aliens: list[Alien] = self.sprites.aliens.sprites()
-        for alien in aliens:
-            yield AlienBullet(self.settings, self.screen, alien.rect)
+    def schedule(self) -> None:
+        self.timers.append(Scheduler().every(2500, self.fire_alien_bullets))
 
-    def fire_alien_bullets(self, dt: int) -> None:
-        self.settings.time_elapsed_since_last_alien_bullet += dt
-        if self.settings.time_elapsed_since_last_alien_bullet > 2500:
-            for bullet in self.create_bullets():
-                bullet.define_position(self.ship)
-                self.sprites.alien_bullets.add(bullet)
-            self.settings.time_elapsed_since_last_alien_bullet = 0
+    def fire_alien_bullets(self) -> None:
+        aliens: list[Alien] = self.sprites.aliens.sprites()
+        self.BULLET.fire(self.settings, self.sprites.alien_bullets, [alien.rect for alien in aliens], self.ship)
 
     def create_alien_fleet(self) -> Generator[Alien]:
         aliens_count = common.get_aliens_row_count(self.settings, Alien.IMAGE.get_rect().width)
@@ -144,13 +177,14 @@ class Stage(BaseStage):
 
     def check_collision(self) -> None:
         super().check_collision()
+        # Aliens moved this step, grid is shared by all alien queries below
+        self.aliens_grid.rebuild(self.sprites.aliens)
+
         # Ship bullets and aliens
-        pygame.sprite.groupcollide(self.sprites.ship_bullets,
-                                   self.sprites.aliens,
-                                   dokilla=True, dokillb=True)
+        collision.check_ship_bullets_aliens_collision(bullets=self.sprites.ship_bullets, aliens=self.aliens_grid)
 
         if any((
-            collision.check_ship_aliens_collision(ship=self.ship, aliens=self.sprites.aliens),
+            collision.check_ship_aliens_collision(ship=self.ship, aliens=self.aliens_grid),
             collision.check_ship_alien_bullets_collision(ship=self.ship, alien_bullets=self.sprites.alien_bullets),
         )):
             common.ship_hit_on_regular_stage(settings=self.settings,
@@ -162,9 +196,8 @@ class Stage(BaseStage):
                 self.sprites.aliens.add(*self.create_alien_fleet())
 
         # Ship shield and alien bullets
-        pygame.sprite.groupcollide(self.sprites.ship_shields,
-                                   self.sprites.alien_bullets,
-                                   dokilla=False, dokillb=True)
+        collision.check_ship_shields_bullets_collision(shields=self.sprites.ship_shields,
+                                                       bullets=self.sprites.alien_bullets)
 
         # Ship and health
         collision.check_ship_health_collision(stats=self.stats,
@@ -178,16 +211,17 @@ class Stage(BaseStage):
                                             ship=self.ship,
                                             ammo=self.sprites.ship_ammo)
         # Bullets and screen edge
-        collision.check_bullets_screen_collision(screen=self.screen,
-                                                 bullets=self.sprites.alien_bullets)
+        collision.check_enemy_bullets_screen_collision(screen=self.screen,
+                                                       bullets=self.sprites.alien_bullets)
 
-    def gameplay(self, dt: int) -> None:
-        self.fire_alien_bullets(dt)
+    def gameplay(self) -> None:
+        pass
 
-    def update(self) -> None:
-        super().update()
-        self.sprites.aliens.update(self.sprites.aliens, self.ship)
-        self.sprites.alien_bullets.update()
+    def update(self, dt: float) -> None:
+        super().update(dt)
+        self.sprites.aliens.steer(self.ship, dt)
+        merge_fleet(self.sprites.aliens)
+        self.sprites.alien_bullets.update(dt)
 
     def teardown(self) -> None:
         super().teardown()
@@ -196,11 +230,8 @@ class Stage(BaseStage):
 
 
 class RedStage(Stage):
-
-    def create_bullets(self) -> Generator[RedAlienBullet]:
-        aliens: list[Alien] = self.sprites.aliens.sprites()
-        for alien in aliens:
-            yield RedAlienBullet(self.settings, self.screen, alien.rect)
+    IMAGES = (*BaseStage.IMAGES, "aliens/red_alien.png", "aliens/red_alien_bullet.png")
+    BULLET = RedAlienBullet
 
     def create_alien_fleet(self) -> Generator[RedAlien]:
         aliens_count = common.get_aliens_row_count(self.settings, Alien.IMAGE.get_rect().width)
@@ -211,11 +242,8 @@ class RedStage(Stage):
 
 
 class BlueStage(Stage):
-
-    def create_bullets(self) -> Generator[BlueAlienBullet]:
-        aliens: list[Alien] = self.sprites.aliens.sprites()
-        for alien in aliens:
-            yield BlueAlienBullet(self.settings, self.screen, alien.rect)
+    IMAGES = (*BaseStage.IMAGES, "aliens/blue_alien.png", "aliens/blue_alien_bullet.png")
+    BULLET = BlueAlienBullet
 
     def create_alien_fleet(self) -> Generator[BlueAlien]:
         aliens_count = common.get_aliens_row_count(self.settings, Alien.IMAGE.get_rect().width)
@@ -226,6 +254,7 @@ class BlueStage(Stage):
 
 
 class BossStage(BaseStage):
+    BULLET: ClassVar[type[BossBullet]]
 
     def __init__(self,
                  settings: Settings,
@@ -236,8 +265,7 @@ class BossStage(BaseStage):
                  ship: Ship,
                  sprites: Sprites,
                  name: str) -> None:
-        super().__init__(screen=screen, sprites=sprites, name=name)
-        self.settings = settings
+        super().__init__(settings=settings, screen=screen, sprites=sprites, name=name)
         self.stats = stats
         self.stages = stages
         self.hud = hud
@@ -248,15 +276,24 @@ class BossStage(BaseStage):
         self.ship.prepare_for_boss()
         rt.rotate_to_up(self.ship)
 
+    def schedule(self) -> None:
+        fire = partial(common.fire_boss_bullets,
+                       settings=self.settings,
+                       ship=self.ship,
+                       bosses=self.sprites.bosses,
+                       boss_bullets=self.sprites.boss_bullets,
+                       bullet=self.BULLET)
+        pattern = self.BULLET.PATTERN
+        self.timers.append(Scheduler().every(pattern.period, fire, delay=pattern.delay))
+
     def transit(self) -> None:
         super().transit()
 
     def check_collision(self) -> None:
         super().check_collision()
         # Ship shield and boss bullets
-        pygame.sprite.groupcollide(self.sprites.ship_shields,
-                                   self.sprites.boss_bullets,
-                                   dokilla=False, dokillb=True)
+        collision.check_ship_shields_bullets_collision(shields=self.sprites.ship_shields,
+                                                       bullets=self.sprites.boss_bullets)
 
         # Ship bullets and bosses
         collision.check_ship_bullets_boss_collision(settings=self.settings, sprites=self.sprites)
@@ -265,21 +302,22 @@ class BossStage(BaseStage):
         collision.check_ship_bullets_boss_shield_collision(self.sprites)
 
         # Boss bullets and screen edge
-        collision.check_bullets_screen_collision(screen=self.screen,
-                                                 bullets=self.sprites.boss_bullets)
+        collision.check_enemy_bullets_screen_collision(screen=self.screen,
+                                                       bullets=self.sprites.boss_bullets)
 
-    def gameplay(self, dt: int) -> None:
+    def gameplay(self) -> None:
         pass
 
-    def update(self) -> None:
-        super().update()
+    def update(self, dt: float) -> None:
+        super().update(dt)
 
         boss: Boss | None = self.sprites.bosses.sprite
         if boss is None:
             raise ValueError
 
-        boss.update()
-        self.sprites.boss_bullets.update()
+        boss.update(dt)
+        self.sprites.boss_bullets.update(dt)
+        common.update_boss_shield(self.sprites)
 
     def teardown(self) -> None:
         super().teardown()
@@ -288,6 +326,15 @@ class BossStage(BaseStage):
 
 
 class GreenBossStage(BossStage):
+    IMAGES = (
+        *BaseStage.IMAGES,
+        "aliens/green_alien.png",
+        "aliens/green_alien_bullet.png",
+        "spawned_green_boss_shield.png",
+        "green_boss_hp",
+        "green_boss_shield",
+    )
+    BULLET = GreenBossBullet
 
     def setup(self) -> None:
         super().setup()
@@ -295,34 +342,33 @@ class GreenBossStage(BossStage):
 
     def check_collision(self) -> None:
         if any((
-            collision.check_ship_boss_bullets_collision(settings=self.settings,
-                                                        stats=self.stats,
+            collision.check_ship_boss_bullets_collision(stats=self.stats,
                                                         hud=self.hud,
                                                         ship=self.ship,
                                                         sprites=self.sprites),
-            collision.check_ship_bosses_collision(settings=self.settings,
-                                                  stats=self.stats,
+            collision.check_ship_bosses_collision(stats=self.stats,
                                                   hud=self.hud,
                                                   ship=self.ship,
                                                   sprites=self.sprites),
         )) and self.stats.ships_left:
             common.create_green_boss(screen=self.screen, sprites=self.sprites)
-            time.sleep(self.settings.game_sleep_time)
+            common.hit_stop(self.settings)
         super().check_collision()
 
-    def gameplay(self, dt: int) -> None:
-        if (boss := self.sprites.bosses.sprite) is None:
-            raise ValueError
-
-        common.fire_green_boss_bullets(settings=self.settings,
-                                       screen=self.screen,
-                                       boss=boss,
-                                       boss_bullets=self.sprites.boss_bullets,
-                                       dt=dt)
-        common.update_green_boss_bullets(self.sprites.boss_bullets)
+    def gameplay(self) -> None:
+        common.update_green_boss_bullets(screen=self.screen, boss_bullets=self.sprites.boss_bullets)
 
 
 class RedBossStage(BossStage):
+    IMAGES = (
+        *BaseStage.IMAGES,
+        "aliens/red_alien.png",
+        "aliens/red_alien_bullet.png",
+        "spawned_red_boss_shield.png",
+        "red_boss_hp",
+        "red_boss_shield",
+    )
+    BULLET = RedBossBullet
 
     def setup(self) -> None:
         super().setup()
@@ -330,79 +376,88 @@ class RedBossStage(BossStage):
 
     def check_collision(self) -> None:
         if any((
-            collision.check_ship_boss_bullets_collision(settings=self.settings,
-                                                        stats=self.stats,
+            collision.check_ship_boss_bullets_collision(stats=self.stats,
                                                         hud=self.hud,
                                                         ship=self.ship,
                                                         sprites=self.sprites),
-            collision.check_ship_bosses_collision(settings=self.settings,
-                                                  stats=self.stats,
+            collision.check_ship_bosses_collision(stats=self.stats,
                                                   hud=self.hud,
                                                   ship=self.ship,
                                                   sprites=self.sprites),
         )) and self.stats.ships_left:
             common.create_red_boss(settings=self.settings, screen=self.screen, sprites=self.sprites)
-            time.sleep(self.settings.game_sleep_time)
+            common.hit_stop(self.settings)
         super().check_collision()
 
-    def gameplay(self, dt: int) -> None:
-        common.fire_red_boss_bullets(settings=self.settings,
-                                     screen=self.screen,
-                                     ship=self.ship,
-                                     bosses=self.sprites.bosses,
-                                     boss_bullets=self.sprites.boss_bullets,
-                                     dt=dt)
-
 
 class BlueBossStage(BossStage):
+    IMAGES = (
+        *BaseStage.IMAGES,
+        "aliens/blue_alien.png",
+        "aliens/blue_alien_bullet.png",
+        "spawned_blue_boss_shield.png",
+        "blue_boss_hp",
+        "blue_boss_shield",
+        "black_hole",
+    )
+    BULLET = BlueBossBullet
+    # Next spawn or removal of black hole, replaced on every one of them.
+    black_hole_timer: Timer | None = None
 
     def setup(self) -> None:
         super().setup()
         common.create_blue_boss(screen=self.screen, sprites=self.sprites)
 
+    def schedule(self) -> None:
+        super().schedule()
+        rotate = partial(common.rotate_black_hole, black_holes=self.sprites.boss_black_holes)
+        scheduler = Scheduler()
+        self.timers.append(scheduler.every(300, rotate))
+        self.black_hole_timer = scheduler.once(2000, self.spawn_black_hole)
+
+    def spawn_black_hole(self) -> None:
+        # Black hole lasts four seconds, next one shows up two seconds after.
+        common.create_black_hole(settings=self.settings,
+                                 screen=self.screen,
+                                 ship=self.ship,
+                                 black_holes=self.sprites.boss_black_holes)
+        self.black_hole_timer = Scheduler().once(4000, self.remove_black_hole)
+
+    def remove_black_hole(self) -> None:
+        self.sprites.boss_black_holes.empty()
+        self.black_hole_timer = Scheduler().once(2000, self.spawn_black_hole)
+
+    def cancel_timers(self) -> None:
+        super().cancel_timers()
+        if self.black_hole_timer is not None:
+            self.black_hole_timer.cancel()
+            self.black_hole_timer = None
+
     def check_collision(self) -> None:
         if any((
-            collision.check_ship_boss_bullets_collision(settings=self.settings,
-                                                        stats=self.stats,
+            collision.check_ship_boss_bullets_collision(stats=self.stats,
                                                         hud=self.hud,
                                                         ship=self.ship,
                                                         sprites=self.sprites),
-            collision.check_ship_bosses_collision(settings=self.settings,
-                                                  stats=self.stats,
+            collision.check_ship_bosses_collision(stats=self.stats,
                                                   hud=self.hud,
                                                   ship=self.ship,
                                                   sprites=self.sprites),
-            collision.check_ship_black_holes_collision(settings=self.settings,
-                                                       stats=self.stats,
+            collision.check_ship_black_holes_collision(stats=self.stats,
                                                        hud=self.hud,
                                                        ship=self.ship,
                                                        sprites=self.sprites),
-        )):
-            self.settings.black_hole_spawn_timer = 0
-            if self.stats.ships_left:
-                self.sprites.boss_black_holes.empty()
-                common.create_blue_boss(screen=self.screen, sprites=self.sprites)
-                time.sleep(self.settings.game_sleep_time)
+        )) and self.stats.ships_left:
+            self.sprites.boss_black_holes.empty()
+            common.create_blue_boss(screen=self.screen, sprites=self.sprites)
+            common.hit_stop(self.settings)
+            self.reschedule()
 
         super().check_collision()
 
-    def gameplay(self, dt: int) -> None:
-        common.fire_blue_boss_bullets(settings=self.settings,
-                                      screen=self.screen,
-                                      bosses=self.sprites.bosses,
-                                      boss_bullets=self.sprites.boss_bullets,
-                                      dt=dt)
-        common.maybe_create_black_hole(settings=self.settings,
-                                       screen=self.screen,
-                                       ship=self.ship,
-                                       black_holes=self.sprites.boss_black_holes)
-        common.update_black_hole(settings=self.settings,
-                                 black_holes=self.sprites.boss_black_holes,
-                                 dt=dt)
-
-    def update(self) -> None:
-        super().update()
-        self.sprites.boss_bullets.update()
+    def update(self, dt: float) -> None:
+        super().update(dt)
+        self.sprites.boss_bullets.update(dt)
 
     def teardown(self) -> None:
         super().teardown()
@@ -424,6 +479,7 @@ class Stages(UserList[StageTypes]):
         self.hud = hud
         self.ship = ship
         self.sprites = sprites
+        self.residency = Residency(budget=settings.image_budget)
 
         super().__init__(self.create_stages())
 
@@ -498,7 +554,7 @@ class Stages(UserList[StageTypes]):
                              name=name)
 
     def create_stages(self) -> list[StageTypes]:
-        return [
+        stages: list[StageTypes] = [
             self.create_stage(name="1_1"),
             self.create_stage(name="1_2"),
             self.create_stage(name="1_3"),
@@ -512,6 +568,9 @@ class Stages(UserList[StageTypes]):
             self.create_blue_stage(name="3_3"),
             self.create_blue_boss_stage(name="blue_boss"),
         ]
+        for stage in stages:
+            self.residency.tag(stage.name, stage.IMAGES)
+        return stages
 
     def get_by_name(self, name: str) -> StageTypes:
         for stage in self:
@@ -519,10 +578,17 @@ class Stages(UserList[StageTypes]):
                 return stage
         raise AssertionError
 
+    def preload(self, stage: StageTypes) -> None:
+        # Images of stage and of stage after it, so setup of neither of them decodes anything.
+        index = self.index(stage)
+        self.residency.activate(*(active.name for active in self.data[index:index + 2]))
+        log.debug("Resident image bytes: %s", self.residency.report())
+
     def select(self, name: str) -> None:
         for stage in self:
             if stage.name == name:
                 self.current = stage
+                self.preload(stage)
                 stage.setup()
                 return
             self.current = stage
@@ -531,10 +597,12 @@ class Stages(UserList[StageTypes]):
 
     def load_next_stage(self) -> StageTypes:
         prev_stage = self.current
-        next_stage = self[prev_stage.index + 1]
+        # Index by position, stages of previous games may still be alive in the same process.
+        next_stage = self[self.index(prev_stage) + 1]
         self.current = next_stage
         prev_stage.teardown()
         prev_stage.transit()
+        self.preload(next_stage)
         next_stage.setup()
         log.info("%s -> %s", prev_stage, next_stage)
         return next_stage
@@ -544,17 +612,19 @@ def maybe_spawn_consumable(screen: Screen,
                            ship: Ship,
                            group: Group,
                            consumable: ShipHealth | ShipAmmo) -> bool:
-    if secrets.choice(range(5)):
+    if rng.choice(range(5)):
         return False
 
     x_padding = consumable.rect.width * 3
     y_padding = consumable.rect.height * 3
-    left_x = range(screen.rect.left + x_padding, ship.rect.left - x_padding)
-    right_x = range(ship.rect.right + x_padding, screen.rect.right - x_padding)
-    top_y = range(screen.rect.top + y_padding, ship.rect.top - y_padding)
-    bottom_y = range(ship.rect.bottom + y_padding, screen.rect.bottom - y_padding)
-    consumable.rect.x = secrets.choice(secrets.choice((left_x or right_x, right_x or left_x)))
-    consumable.rect.y = secrets.choice(secrets.choice((top_y or bottom_y, bottom_y or top_y)))
+    spawn_x = SpawnRange(screen.rect.left + x_padding,
+                         screen.rect.right - x_padding,
+                         range(int(ship.rect.left - x_padding), int(ship.rect.right + x_padding)))
+    spawn_y = SpawnRange(screen.rect.top + y_padding,
+                         screen.rect.bottom - y_padding,
+                         range(int(ship.rect.top - y_padding), int(ship.rect.bottom + y_padding)))
+    consumable.rect.x = spawn_x.choice()
+    consumable.rect.y = spawn_y.choice()
     group.add(consumable)
     return True
 
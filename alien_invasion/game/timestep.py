@@ -0,0 +1,56 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pygame.rect import FRect, Rect
+
+    from game.sprites import Drawable
+
+
+class FixedTimestep:
+    """Split real frame time into fixed simulation steps.
+
+    Leftover time is kept in accumulator and used as interpolation factor for rendering.
+
+    """
+
+    def __init__(self, rate: int, max_frame_time: float) -> None:
+        self.step = 1000 / rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self) -> float:
+        return self.accumulator / self.step
+
+    def advance(self, frame_time: float) -> int:
+        # Add frame time to accumulator and return count of simulation steps to run.
+        # Clamp long frames (window drag, breakpoints) to avoid spiral of death.
+        self.accumulator += min(frame_time, self.max_frame_time)
+        steps = int(self.accumulator // self.step)
+        self.accumulator -= steps * self.step
+        return steps
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+
+
+class Interpolation:
+    """Remember sprite positions before simulation step to draw them between two steps."""
+
+    def __init__(self) -> None:
+        self.previous: dict[Drawable, tuple[float, float]] = {}
+
+    def snapshot(self, sprites: Iterable[Drawable]) -> None:
+        self.previous = {sprite: sprite.rect.center for sprite in sprites}
+
+    def rect(self, sprite: Drawable, alpha: float) -> Rect | FRect:
+        rect = sprite.rect
+        if (previous := self.previous.get(sprite)) is None:
+            return rect
+
+        previous_x, previous_y = previous
+        current_x, current_y = rect.center
+        return rect.move(round((previous_x - current_x) * (1 - alpha)),
+                         round((previous_y - current_y) * (1 - alpha)))
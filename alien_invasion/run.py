@@ -1,4 +1,6 @@
 import logging
+import math
+import os
 from argparse import ArgumentParser, Namespace
 from datetime import UTC, datetime
 
@@ -9,20 +11,30 @@ from game.gf import common, events
 from game.hud import Hud
 from game.paths import Paths
 from game.pause_menu import PauseMenu
+from game.renderer import DirtyRenderer
+from game.scheduler import Scheduler
 from game.screen import Screen
 from game.settings import Settings
 from game.ship import Ship
+from game.sounds import AUDIO_BUFFER, LOW_LATENCY_AUDIO_BUFFER, Sounds
 from game.sprites import Sprites
 from game.stages import Stages
 from game.state import GameState, State
 from game.stats import Stats
+from game.timestep import FixedTimestep, Interpolation
 
 
-def initialize() -> None:
+def initialize(*, headless: bool, audio_buffer: int = AUDIO_BUFFER) -> None:
+    if headless:
+        # No window and no sound card required.
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    # Mixer is initialized by pygame.init, so its settings go first.
+    pygame.mixer.pre_init(44100, -16, 2, audio_buffer)
     pygame.init()
     pygame.display.set_caption("Alien Invasion")
-    pygame.mixer.pre_init(44100, -16, 2, 2048)
     pygame.mixer.init()
+    Sounds().load()
 
 
 def configure_logger() -> None:
@@ -32,6 +44,37 @@ def configure_logger() -> None:
     logging.basicConfig(filename=filepath, format=fmt, level=logging.DEBUG)
 
 
+def simulate(settings: Settings,
+             screen: Screen,
+             stats: Stats,
+             ship: Ship,
+             sprites: Sprites,
+             stages: Stages,
+             dt: float) -> bool:
+    # Advance game by one simulation step. Return False, when game is over.
+    # Timers of stages run first, e.g. enemy fire.
+    if not Scheduler().advance(dt):
+        # Hit-stop: time passes, but nothing moves.
+        return True
+
+    ship.update(dt)
+
+    if not (sprites.aliens or sprites.bosses) and stats.ships_left:
+        if stages.current == stages.last:
+            events.end_game(settings=settings, screen=screen, stages=stages)
+            return False
+        stages.load_next_stage()
+
+    stages.current.update(dt)
+    stages.current.gameplay()
+    stages.current.check_collision()
+
+    if stats.ships_left < 1:
+        events.end_game(settings=settings, screen=screen, stages=stages)
+        return False
+    return True
+
+
 def run_game(args: Namespace) -> None:  # ruff:ignore[too-many-locals]
     if filepath := args.record_events:
         events.Events().record_filepath = filepath
@@ -39,10 +82,10 @@ def run_game(args: Namespace) -> None:  # ruff:ignore[too-many-locals]
     if filepath := args.playback_events:
         events.Events().load(filepath)
 
-    initialize()
+    initialize(headless=args.headless, audio_buffer=LOW_LATENCY_AUDIO_BUFFER if args.low_latency_audio else AUDIO_BUFFER)
 
     settings = Settings(health=args.health)
-    screen = Screen(settings.screen_width, settings.screen_height)
+    screen = Screen(settings.screen_width, settings.screen_height, headless=args.headless)
     buttons = Buttons(screen)
     ship = Ship(settings, screen)
     stats = Stats(settings)
@@ -63,13 +106,17 @@ def run_game(args: Namespace) -> None:  # ruff:ignore[too-many-locals]
 
     state = GameState(State.MAIN_MENU)
     clock = pygame.time.Clock()
+    timestep = FixedTimestep(rate=settings.simulation_rate, max_frame_time=settings.max_frame_time)
+    interpolation = Interpolation()
+    renderer = DirtyRenderer(screen=screen, background=settings.bg_color)
 
     # Main game cycle
     while True:
-        # Pause state
+        # Pause state, menus are drawn only when shown first or when they change.
+        redraw = True
         while state(State.PAUSED):
             pygame.mouse.set_visible(True)
-            pause_events = events.check_pause_events(ship, pause_menu)
+            pause_events = events.check_pause_events(ship, pause_menu, timeout=settings.menu_wait_timeout)
             if pause_events.quit:
                 events.quit_game()
             if pause_events.unpause:
@@ -79,20 +126,32 @@ def run_game(args: Namespace) -> None:  # ruff:ignore[too-many-locals]
                 events.end_game(settings=settings, screen=screen, stages=stages)
                 state.set(State.MAIN_MENU)
 
-            common.update_pause_screen(pause_menu)
+            if not screen.headless:
+                common.update_pause_screen(pause_menu, redraw=redraw or pause_events.redraw)
+            redraw = False
 
         # Menu state
+        redraw = True
         while state(State.MAIN_MENU):
             pygame.mouse.set_visible(True)
 
-            menu_events = events.check_main_menu_events(buttons.START)
-            common.update_main_menu_screen(settings=settings,
-                                           screen=screen,
-                                           start_button=buttons.START)
+            # Screen of finished game stays blank until hit-stop is over, menu sleeps until then.
+            scheduler = Scheduler()
+            due = scheduler.next_due() if scheduler.frozen else None
+            timeout = settings.menu_wait_timeout if due is None else math.ceil(due)
+            menu_events = events.check_main_menu_events(buttons.START, timeout=timeout)
+            elapsed = clock.tick()
+            if scheduler.frozen:
+                scheduler.advance(elapsed)
+            if not screen.headless and not scheduler.frozen:
+                common.update_main_menu_screen(settings=settings,
+                                               screen=screen,
+                                               start_button=buttons.START,
+                                               redraw=redraw or menu_events.redraw)
+                redraw = False
 
             if menu_events.play:
-                common.initialize_game_from_main_menu(settings=settings,
-                                                      stats=stats,
+                common.initialize_game_from_main_menu(stats=stats,
                                                       hud=hud,
                                                       ship=ship)
                 stages.select(args.stage or stages.first.name)
@@ -102,8 +161,12 @@ def run_game(args: Namespace) -> None:  # ruff:ignore[too-many-locals]
 
         # Active game state
         framerate = settings.framerate
+        timestep.reset()
+        renderer.invalidate()
+        clock.tick()
         while state(State.ACTIVE):
-            dt = clock.tick(framerate)
+            # Headless game runs in virtual time: one step per iteration without frame cap.
+            steps = 1 if screen.headless else timestep.advance(clock.tick(framerate))
             active_events = events.check_active_game_events(settings=settings,
                                                             screen=screen,
                                                             stats=stats,
@@ -116,29 +179,29 @@ def run_game(args: Namespace) -> None:  # ruff:ignore[too-many-locals]
                 state.set(State.PAUSED)
 
             common.handle_ship_diagonal_movement(ship)
-            ship.update()
 
-            if not (sprites.aliens or sprites.bosses) and stats.ships_left:
-                if stages.current == stages.last:
+            # Simulation runs with fixed step independently from rendering rate.
+            for _ in range(steps):
+                if not screen.headless:
+                    interpolation.snapshot(common.drawable_sprites(ship, sprites))
+                if not simulate(settings=settings,
+                                screen=screen,
+                                stats=stats,
+                                ship=ship,
+                                sprites=sprites,
+                                stages=stages,
+                                dt=timestep.step):
                     state.set(State.MAIN_MENU)
-                    events.end_game(settings=settings, screen=screen, stages=stages)
-                    continue
-                stages.load_next_stage()
-
-            stages.current.update()
-            stages.current.gameplay(dt)
-            stages.current.check_collision()
-
-            common.update_screen(settings=settings,
-                                 screen=screen,
-                                 hud=hud,
-                                 ship=ship,
-                                 sprites=sprites,
-                                 dt=dt)
-
-            if stats.ships_left < 1:
-                state.set(State.MAIN_MENU)
-                events.end_game(settings=settings, screen=screen, stages=stages)
+                    break
+            else:
+                if not screen.headless:
+                    common.update_screen(screen=screen,
+                                         hud=hud,
+                                         ship=ship,
+                                         sprites=sprites,
+                                         interpolation=interpolation,
+                                         renderer=renderer,
+                                         alpha=timestep.alpha)
 
 
 if __name__ == "__main__":
@@ -147,6 +210,8 @@ if __name__ == "__main__":
     parser.add_argument("--health", type=int)
     parser.add_argument("--record-events", type=str)
     parser.add_argument("--playback-events", type=str)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--low-latency-audio", action="store_true")
     args = parser.parse_args()
 
     if args.record_events and args.playback_events:
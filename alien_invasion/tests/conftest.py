@@ -2,6 +2,17 @@ from argparse import Namespace
 
 import pytest
 
+from game.screen import Screen
+from game.settings import Settings
+from game.ship import Ship
+from game.utils import Singleton
+from run import initialize
+
+
+@pytest.fixture(autouse=True)  # ruff:ignore[pytest-fixture-autouse]
+def reset_singletons() -> None:
+    Singleton._instances.clear()  # ruff:ignore[private-member-access]
+
 
 @pytest.fixture
 def namespace() -> Namespace:
@@ -10,4 +21,27 @@ def namespace() -> Namespace:
         health=None,
         stage=None,
         play_events=None,
+        headless=True,
+        low_latency_audio=False,
     )
+
+
+@pytest.fixture
+def headless() -> None:
+    initialize(headless=True)
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings(health=None)
+
+
+@pytest.fixture
+def screen(settings: Settings) -> Screen:
+    initialize(headless=True)
+    return Screen(settings.screen_width, settings.screen_height, headless=True)
+
+
+@pytest.fixture
+def ship(settings: Settings, screen: Screen) -> Ship:
+    return Ship(settings, screen)
@@ -0,0 +1,30 @@
+from pygame.rect import Rect
+from pygame.sprite import Group, Sprite
+
+from game.alien import merge_fleet
+
+
+def make_fleet(*rects: Rect) -> tuple[Group, list[Sprite]]:
+    fleet = []
+    for rect in rects:
+        alien = Sprite()
+        alien.rect = rect
+        fleet.append(alien)
+    return Group(fleet), fleet
+
+
+def test_merge_fleet_keeps_earlier_alien() -> None:
+    aliens, (first, second, distant) = make_fleet(Rect(100, 100, 60, 58),
+                                                  Rect(70, 120, 60, 58),
+                                                  Rect(500, 100, 60, 58))
+    merge_fleet(aliens)
+    assert aliens.sprites() == [first, distant]
+    assert not second.alive()
+
+
+def test_merge_fleet_ignores_aliens_overlapping_only_merged_alien() -> None:
+    aliens, (first, _, third) = make_fleet(Rect(0, 0, 60, 58),
+                                           Rect(50, 0, 60, 58),
+                                           Rect(100, 0, 60, 58))
+    merge_fleet(aliens)
+    assert aliens.sprites() == [first, third]
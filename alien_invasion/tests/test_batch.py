@@ -0,0 +1,29 @@
+import pytest
+
+from batch import Job, Result, Session, advance, play, run_batch
+
+
+@pytest.mark.usefixtures("headless")
+def test_play_is_reproducible_with_seed() -> None:
+    first = play(Job(stage="1_1", seed=7, steps=3000))
+    second = play(Job(stage="1_1", seed=7, steps=3000))
+    assert first.result is not Result.CRASHED, first.error
+    assert (first.result, first.steps, first.ships_left) == (second.result, second.steps, second.ships_left)
+
+
+def test_run_batch_merges_outcomes() -> None:
+    jobs = [Job(stage=stage, seed=seed, steps=500) for stage in ("1_1", "green_boss") for seed in range(2)]
+    report = run_batch(jobs, workers=2)
+    assert report["jobs"] == len(report["runs"]) == 4
+    assert report["stages"]["1_1"]["runs"] == report["stages"]["green_boss"]["runs"] == 2
+    assert not any(run["result"] == Result.CRASHED for run in report["runs"])
+
+
+@pytest.mark.usefixtures("headless")
+@pytest.mark.parametrize("name", ["green_boss", "blue_boss"])
+def test_advance_reports_cleared_stage(name: str) -> None:
+    session = Session.create(health=None)
+    session.stages.select(name)
+    stage = session.stages.current
+    session.sprites.bosses.empty()
+    assert advance(session=session, stage=stage, autopilot=None, dt=1000 / session.settings.simulation_rate) is Result.CLEARED
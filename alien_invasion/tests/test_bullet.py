@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from game.bullet import MUZZLES, Bullet
+from game.screen import ScreenSide
+
+if TYPE_CHECKING:
+    from game.settings import Settings
+    from game.ship import Ship
+
+
+@pytest.mark.parametrize("rotation", [side for side in ScreenSide if side in MUZZLES])
+def test_bullet_moves_from_muzzle_in_ship_direction(rotation: ScreenSide, settings: Settings, ship: Ship) -> None:
+    ship.current_ship_rotation = rotation
+    bullet = Bullet(settings, ship.screen, ship)
+    (offset_x, offset_y), (direction_x, direction_y) = MUZZLES[rotation]
+    assert bullet.rect.center == (ship.rect.centerx + offset_x, ship.rect.centery + offset_y)
+
+    distance = settings.bullet_speed_factor * 100
+    bullet.update(100)
+    assert bullet.rect.center == pytest.approx((ship.rect.centerx + offset_x + direction_x * distance,
+                                                ship.rect.centery + offset_y + direction_y * distance))
@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+
+from game.buttons import Buttons
+
+if TYPE_CHECKING:
+    from game.screen import Screen
+
+
+def test_button_reports_only_hover_changes(screen: Screen) -> None:
+    button = Buttons(screen).START
+    outside, inside = (0, 0), button.ellipse_rect.center
+
+    assert not button.update(outside)
+    assert button.update(inside)
+    assert not button.update(inside)
+    assert button.hovered
+    assert button.update(outside)
+    assert not button.hovered
@@ -0,0 +1,94 @@
+import pygame
+import pytest
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+from game.boss_bullets import GreenBossBullet
+from game.enemy_bullets import VOLLEY_BUDGET, EnemyBullets, velocities, velocity
+
+
+@pytest.fixture
+def bullets() -> EnemyBullets:
+    return EnemyBullets()
+
+
+@pytest.fixture
+def image() -> Surface:
+    return Surface((10, 10))
+
+
+def test_update_moves_by_velocity(bullets: EnemyBullets, image: Surface) -> None:
+    bullets.spawn((100, 100), velocity(90, 0.5), image)
+    bullets.update(10)
+    assert bullets.x[0] == pytest.approx(100)
+    assert bullets.y[0] == pytest.approx(95)
+    assert bullets.rects[0].center == (100, 95)
+
+
+def test_cull_removes_bullets_outside_bounds(bullets: EnemyBullets, image: Surface) -> None:
+    bullets.spawn((100, 100), (0, 0), image)
+    bullets.spawn((500, 100), (0, 0), image)
+    bullets.cull(Rect(0, 0, 200, 200))
+    assert len(bullets) == 1
+    assert bullets.x == [100]
+
+
+def test_bounce_reflects_until_last_bounce_removes_bullet(bullets: EnemyBullets, image: Surface) -> None:
+    bounds = Rect(0, 0, 200, 200)
+    bullets.spawn((198, 100), (1, 0), image, bounces=2)
+    bullets.spawn((198, 150), (1, 0), image)
+    bullets.bounce(bounds)
+    assert (bullets.vx, bullets.bounces) == ([-1, 1], [1, 0])
+    bullets.vx[0] = 1
+    bullets.bounce(bounds)
+    # Bullet without bounces is never reflected and leaves the screen.
+    assert (bullets.y, bullets.vx) == ([150], [1])
+
+
+def test_green_boss_bullets_are_removed_on_fourth_bounce(bullets: EnemyBullets, image: Surface) -> None:
+    bounds = Rect(0, 0, 200, 200)
+    bullets.spawn((100, 100), (1, 0), image, bounces=GreenBossBullet.PATTERN.bounces)
+    hits = 0
+    while bullets:
+        bounces = bullets.bounces[0]
+        bullets.update(1)
+        bullets.bounce(bounds)
+        hits += not bullets or bullets.bounces[0] != bounces
+    assert hits == 4
+
+
+def test_collisions(bullets: EnemyBullets, image: Surface) -> None:
+    bullets.spawn((100, 100), (0, 0), image)
+    bullets.spawn((300, 300), (0, 0), image)
+    assert bullets.collide(Rect(95, 95, 10, 10))
+    assert not bullets.collide(Rect(0, 0, 10, 10))
+    bullets.kill_colliding([Rect(295, 295, 10, 10)])
+    assert bullets.x == [100]
+    bullets.empty()
+    assert not bullets
+
+
+def test_draw(bullets: EnemyBullets, image: Surface) -> None:
+    surface = Surface((200, 200))
+    image.fill(pygame.Color("red"))
+    bullets.spawn((100, 100), (0, 0), image)
+    bullets.draw(surface)
+    assert surface.get_at((100, 100)) == pygame.Color("red")
+
+
+def test_volley_spawns_within_budget_per_step(bullets: EnemyBullets, image: Surface) -> None:
+    count = VOLLEY_BUDGET * 2 + 1
+    bullets.spawn_volley([(100, 100)] * count, velocities(range(count), 0.5), image)
+    assert not bullets
+    for spawned in (VOLLEY_BUDGET, VOLLEY_BUDGET * 2, count, count):
+        bullets.update(10)
+        assert len(bullets) == spawned
+    assert bullets.vx == [vx for vx, _ in velocities(range(count), 0.5)]
+
+
+def test_empty_drops_queued_volley(bullets: EnemyBullets, image: Surface) -> None:
+    bullets.spawn_volley([(100, 100)] * VOLLEY_BUDGET * 2, [(0, 0)] * VOLLEY_BUDGET * 2, image)
+    bullets.update(10)
+    bullets.empty()
+    bullets.update(10)
+    assert not bullets
@@ -0,0 +1,21 @@
+import time
+from typing import TYPE_CHECKING
+
+import pygame
+from pygame.event import Event
+
+from game.buttons import Buttons
+from game.gf.events import Events, check_main_menu_events
+
+if TYPE_CHECKING:
+    from game.screen import Screen
+
+
+def test_main_menu_does_not_wait_for_input_while_playing_events(screen: Screen) -> None:
+    Events().feed([])
+    Events().feed([Event(pygame.KEYDOWN, key=pygame.K_RETURN)])
+
+    start = time.perf_counter()
+    assert not check_main_menu_events(Buttons(screen).START, timeout=10_000).play
+    assert check_main_menu_events(Buttons(screen).START, timeout=10_000).play
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,8 @@
+import pytest
+
+from game import find_angle as fa
+
+
+@pytest.mark.parametrize(("value", "angle"), [(0.5, 59), (0.9999, 1), (1.0, 1), (0.0, 89), (0.0175, 88)])
+def test_find_angle_with_cos(value: float, angle: int) -> None:
+    assert fa.find_angle_with_cos(value) == angle
@@ -0,0 +1,40 @@
+from typing import TYPE_CHECKING
+
+from game.alien import Alien
+from game.fleet import Fleet
+
+if TYPE_CHECKING:
+    from game.screen import Screen
+    from game.settings import Settings
+    from game.ship import Ship
+
+
+def make_alien(settings: Settings, screen: Screen, ship: Ship, x: float, y: float) -> Alien:
+    alien = Alien(settings=settings, screen=screen, ship=ship)
+    alien.rect.center = (x, y)
+    return alien
+
+
+def test_steer_moves_fleet_toward_ship(settings: Settings, screen: Screen, ship: Ship) -> None:
+    x, y = ship.rect.center
+    fleet = Fleet(make_alien(settings, screen, ship, x - 100, y + 100),
+                  make_alien(settings, screen, ship, x + 0.5, y))
+    fleet.steer(ship, dt=10)
+
+    left, near = fleet.aliens
+    assert left.rect.center == (x - 99, y + 99)
+    # Alien does not step past the ship from the right.
+    assert (fleet.x[1], fleet.y[1]) == (x + 0.5, y)
+    assert near.rect.center == (x + 0.5, y)
+
+
+def test_remove_keeps_positions_in_sync(settings: Settings, screen: Screen, ship: Ship) -> None:
+    aliens = [make_alien(settings, screen, ship, x, 100) for x in (100, 200, 300)]
+    fleet = Fleet(*aliens)
+    aliens[0].kill()
+
+    assert fleet.aliens == [aliens[2], aliens[1]]
+    assert fleet.x == [300, 200]
+    assert fleet.index == {aliens[2]: 0, aliens[1]: 1}
+    fleet.empty()
+    assert (fleet.aliens, fleet.x, fleet.y, fleet.speed, fleet.index) == ([], [], [], [], {})
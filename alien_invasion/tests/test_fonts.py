@@ -0,0 +1,15 @@
+import pygame
+import pytest
+
+from game.fonts import load_font
+
+
+@pytest.mark.usefixtures("headless")
+def test_fonts_are_shared_until_pygame_quits() -> None:
+    font = load_font(40)
+    assert load_font(40) is font
+    assert load_font(20) is not font
+
+    pygame.quit()
+    pygame.init()
+    assert load_font(40).render("Menu", True, (255, 255, 255)).get_width() > 0  # ruff:ignore[boolean-positional-value-in-call]
@@ -0,0 +1,25 @@
+import pytest
+
+from batch import Session
+from game.gf import common
+from game.scheduler import Scheduler
+
+
+@pytest.mark.usefixtures("headless")
+def test_hit_stop_suspends_simulation_for_its_time() -> None:
+    session = Session.create(health=None)
+    session.stages.select("1_1")
+    session.ship.moving_right = True
+    dt = 1000 / session.settings.simulation_rate
+
+    common.hit_stop(session.settings)
+    x = session.ship.rect.x
+    steps = 0
+    while Scheduler().frozen:
+        assert session.step(dt)
+        steps += 1
+    assert session.ship.rect.x == x
+    assert steps == pytest.approx(session.settings.hit_stop_time / dt, abs=1)
+
+    session.step(dt)
+    assert session.ship.rect.x > x
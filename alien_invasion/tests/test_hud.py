@@ -0,0 +1,61 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from game.gf import common
+from game.hud import Hud
+from game.sprites import Sprites
+from game.stats import Stats
+
+if TYPE_CHECKING:
+    from game.screen import Screen
+    from game.settings import Settings
+    from game.ship import Ship
+
+
+@pytest.fixture
+def sprites() -> Sprites:
+    return Sprites()
+
+
+@pytest.fixture
+def stats(settings: Settings) -> Stats:
+    return Stats(settings)
+
+
+@pytest.fixture
+def hud(settings: Settings, screen: Screen, stats: Stats, ship: Ship, sprites: Sprites) -> Hud:
+    return Hud(settings, screen, stats, ship, sprites)
+
+
+def test_hud_draws_one_area_per_stat(hud: Hud, stats: Stats) -> None:
+    stats.ships_left, stats.ammo, stats.shields_left = 3, 20, 1
+    drawn = hud.show_hud()
+    assert len(drawn) == 3
+    assert drawn[1].width > drawn[0].width
+
+
+def test_hud_is_composed_again_only_when_invalidated(hud: Hud,
+                                                     settings: Settings,
+                                                     screen: Screen,
+                                                     stats: Stats,
+                                                     sprites: Sprites) -> None:
+    hud.show_hud()
+    layer = hud.layer
+    stats.ammo += 1
+    hud.show_hud()
+    assert hud.layer is layer
+
+    hud.invalidate()
+    hud.show_hud()
+    assert hud.layer is not layer
+
+    # Boss health frame changes on every hit of boss.
+    common.create_red_boss(settings=settings, screen=screen, sprites=sprites)
+    hud.show_hud()
+    layer = hud.layer
+    boss = sprites.bosses.sprite
+    assert boss is not None
+    boss.prepare_health()
+    hud.show_hud()
+    assert hud.layer is not layer
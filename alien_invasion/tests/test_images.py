@@ -0,0 +1,82 @@
+from typing import TYPE_CHECKING
+
+import pygame
+import pytest
+from pygame.surface import Surface
+
+from game import images, stages
+from game.images import build_atlas, pack
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_pack_places_surfaces_without_overlap() -> None:
+    surfaces = [Surface(size) for size in ((60, 48), (13, 13), (200, 30), (50, 50), (120, 120))]
+    rects = pack(surfaces, width=256)
+    assert [rect.size for rect in rects] == [surface.get_size() for surface in surfaces]
+    assert all(rect.right <= 256 for rect in rects)
+    assert all(rect.collidelist(rects[:index]) == -1 for index, rect in enumerate(rects))
+
+
+@pytest.mark.usefixtures("screen")
+def test_build_atlas_keeps_pixels() -> None:
+    surfaces = []
+    for color in ((255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 0)):
+        surface = Surface((10, 20), pygame.SRCALPHA)
+        surface.fill(color)
+        surfaces.append(surface)
+
+    subsurfaces = build_atlas(surfaces)
+    assert len({subsurface.get_parent() for subsurface in subsurfaces}) == 1
+    for surface, subsurface in zip(surfaces, subsurfaces, strict=True):
+        assert pygame.image.tobytes(subsurface, "RGBA") == pygame.image.tobytes(surface, "RGBA")
+
+
+def test_stage_images_are_registered() -> None:
+    stage_classes = (stages.Stage,
+                     stages.RedStage,
+                     stages.BlueStage,
+                     stages.GreenBossStage,
+                     stages.RedBossStage,
+                     stages.BlueBossStage)
+    keys = {key for stage in stage_classes for key in stage.IMAGES}
+    assert keys <= images.registry.keys()
+
+
+@pytest.mark.usefixtures("screen")
+def test_image_cache_shares_pixels_of_decoded_images(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    sources = {"ship_up.png": False, "bullet.png": False, "green_boss_hp": True}
+    keys = sources.keys()
+    monkeypatch.setattr(images, "registry", {})
+    for key, sequence in sources.items():
+        images.register(key, sequence=sequence, atlas=False)
+    path = tmp_path / images.CACHE_NAME
+    images.open_cache(path)
+    # Cache is written through a temporary file, which is moved over the cache.
+    assert list(tmp_path.iterdir()) == [path]
+    expected = {key: [pygame.image.tobytes(surface, "RGBA") for surface in images.registry[key].get()] for key in keys}
+
+    monkeypatch.setattr(images, "registry", {})
+    for key, sequence in sources.items():
+        images.register(key, sequence=sequence, atlas=False)
+    images.open_cache(path)
+    for key in keys:
+        asset = images.registry[key]
+        # Cached images are still decoded on first use.
+        assert not asset.loaded
+        assert [pygame.image.tobytes(surface, "RGBA") for surface in asset.get()] == expected[key]
+        assert all(surface.get_flags() & pygame.PREALLOC for surface in asset.surfaces)
+
+
+@pytest.mark.usefixtures("screen")
+def test_image_cache_is_skipped_without_cache_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    def caches() -> Path:
+        raise PermissionError
+
+    monkeypatch.setattr(images.Paths, "caches", caches)
+    monkeypatch.setattr(images, "registry", {})
+    asset = images.register("ship_up.png", sequence=False, atlas=False)
+    images.open_cache()
+    assert not asset.cached
+    assert asset.get()
@@ -0,0 +1,31 @@
+import math
+from typing import TYPE_CHECKING
+
+import pytest
+
+from game.patterns import DIRECTIONS, Spiral, Spread, direction
+
+if TYPE_CHECKING:
+    from game.ship import Ship
+
+
+def test_directions_are_unit_vectors_of_whole_degrees() -> None:
+    for angle in (0, 45, 90, 200, 359):
+        assert DIRECTIONS[angle] == pytest.approx(direction(angle))
+        assert math.hypot(*DIRECTIONS[angle]) == pytest.approx(1)
+    assert direction(90) == pytest.approx((0, -1))
+
+
+def test_spiral_turns_back_past_its_limits() -> None:
+    pattern = Spiral(period=300, angles=(0,), step=15, limits=(0, 400))
+    # Turn of volleys fired before, goes up past 400 and down past 0, then repeats.
+    turns = [*range(0, 406, 15), *range(390, -16, -15)]
+    assert len(pattern.volleys) == len(turns)
+    for step, turn in enumerate([*turns, *turns]):
+        assert pattern.volley(step, (0, 0), None) == [DIRECTIONS[turn % 360]]  # type: ignore[arg-type]
+
+
+def test_spread_turns_aimed_direction(ship: Ship) -> None:
+    origin = (ship.rect.centerx, ship.rect.centery - 100)
+    pattern = Spread(period=1000, angles=(0, 90, -90))
+    assert pattern.volley(0, origin, ship) == [pytest.approx(turned) for turned in ((0, 1), (-1, 0), (1, 0))]
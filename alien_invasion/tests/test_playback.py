@@ -1,5 +1,7 @@
+import json
 from typing import TYPE_CHECKING
 
+import pygame
 import pytest
 
 from game.paths import Paths
@@ -7,6 +9,7 @@ from run import run_game
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from pathlib import Path
 
 
 def test_press_play_button_enter_and_quit(namespace: Namespace) -> None:
@@ -14,3 +17,17 @@ def test_press_play_button_enter_and_quit(namespace: Namespace) -> None:
     namespace.playback_events = events
     with pytest.raises(SystemExit):
         run_game(namespace)
+
+
+@pytest.mark.parametrize("stage", ["1_1", "green_boss", "red_boss", "blue_boss"])
+def test_headless_stage_playback(namespace: Namespace, tmp_path: Path, stage: str) -> None:
+    start = [{"type": pygame.KEYDOWN, "dict": {"key": pygame.K_RETURN}}]
+    fire = [{"type": pygame.KEYDOWN, "dict": {"key": pygame.K_a}}]
+    quit_ = [{"type": pygame.QUIT, "dict": {}}]
+    events = tmp_path / "events.json"
+    events.write_text(json.dumps([start, *([fire, []] * 1000), quit_]), encoding="utf-8")
+
+    namespace.playback_events = events
+    namespace.stage = stage
+    with pytest.raises(SystemExit):
+        run_game(namespace)
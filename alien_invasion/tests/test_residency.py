@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+import pytest
+
+from batch import Session
+from game import images
+from game.residency import Residency
+
+
+def test_residency_evicts_least_recently_used_images_of_inactive_stages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(images, "registry", {})
+    for key in ("ship_up.png", "aliens/green_alien.png", "green_boss_hp", "aliens/red_alien.png"):
+        images.register(key, sequence="." not in key, atlas=False)
+    residency = Residency(budget=0)
+    residency.tag("1_1", ("ship_up.png", "aliens/green_alien.png"))
+    residency.tag("green_boss", ("ship_up.png", "green_boss_hp"))
+    residency.tag("2_1", ("ship_up.png", "aliens/red_alien.png"))
+
+    residency.activate("1_1", "green_boss")
+    assert all(asset.loaded for key, asset in images.registry.items() if key != "aliens/red_alien.png")
+
+    residency.activate("green_boss", "2_1")
+    assert not images.registry["aliens/green_alien.png"].loaded
+    assert images.registry["green_boss_hp"].loaded
+
+    residency.activate("2_1")
+    assert not images.registry["green_boss_hp"].loaded
+    report = residency.report()
+    assert report["green_boss"] == report["1_1"] == images.registry["ship_up.png"].size > 0
+    assert report["2_1"] > report["1_1"]
+
+
+@pytest.mark.usefixtures("screen")
+def test_residency_keeps_atlas_images_of_inactive_stages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(images, "registry", {})
+    for key in ("ship_up.png", "aliens/green_alien_bullet.png", "aliens/red_alien_bullet.png"):
+        images.register(key, sequence=False, atlas=True)
+    build_atlas = Mock(wraps=images.build_atlas)
+    monkeypatch.setattr(images, "build_atlas", build_atlas)
+    residency = Residency(budget=0)
+    residency.tag("1_1", ("ship_up.png", "aliens/green_alien_bullet.png"))
+    residency.tag("2_1", ("ship_up.png", "aliens/red_alien_bullet.png"))
+
+    residency.activate("1_1")
+    residency.activate("2_1")
+    assert images.registry["aliens/green_alien_bullet.png"].loaded
+    residency.activate("1_1")
+    # Atlas of the first stage and atlas of red bullet, which was not packed yet.
+    assert build_atlas.call_count == 2
+
+
+@pytest.mark.usefixtures("headless")
+def test_images_of_inactive_stages_fit_into_budget() -> None:
+    session = Session.create(health=None)
+    residency = session.stages.residency
+    for stage in session.stages:
+        session.stages.select(stage.name)
+        inactive = sum(images.registry[key].size for key in residency.used.keys() - residency.active)
+        assert inactive <= residency.budget, stage.name
+    # Regular stage after all bosses fits into budget with its own images.
+    session.stages.select("3_1")
+    assert sum(images.registry[key].size for key in residency.used) <= residency.budget
@@ -0,0 +1,56 @@
+import pytest
+
+from batch import Session
+from game.scheduler import Scheduler
+
+
+def test_timers_run_in_due_order() -> None:
+    scheduler = Scheduler()
+    calls: list[str] = []
+    scheduler.every(300, lambda: calls.append("every"), delay=100)
+    scheduler.once(250, lambda: calls.append("once"))
+    for _ in range(10):
+        scheduler.advance(100)
+    assert calls == ["every", "once", "every", "every", "every"]
+    assert scheduler.next_due() == 300
+
+
+def test_cancelled_timer_does_not_run() -> None:
+    scheduler = Scheduler()
+    calls: list[int] = []
+    timer = scheduler.every(100, lambda: calls.append(1))
+    scheduler.advance(100)
+    timer.cancel()
+    scheduler.advance(500)
+    assert calls == [1]
+    assert scheduler.next_due() is None
+
+
+def test_freeze_suspends_timers() -> None:
+    scheduler = Scheduler()
+    calls: list[int] = []
+    scheduler.once(100, lambda: calls.append(1))
+    scheduler.advance(50)
+    scheduler.freeze(300)
+    assert scheduler.next_due() == 300
+    assert not scheduler.advance(200)
+    assert not scheduler.advance(100)
+    assert scheduler.next_due() == 50
+    assert scheduler.advance(50)
+    assert calls == [1]
+
+
+@pytest.mark.usefixtures("headless")
+def test_black_hole_cycle_keeps_one_timer() -> None:
+    session = Session.create(health=None)
+    session.stages.select("blue_boss")
+    stage = session.stages.current
+    timers = len(stage.timers)
+    for _ in range(6):
+        # Every black hole spawns and is removed within six seconds.
+        Scheduler().advance(6000)
+    assert len(stage.timers) == timers
+    assert len([timer for timer in Scheduler().timers if not timer.cancelled]) == timers + 1
+
+    stage.teardown()
+    assert all(timer.cancelled for timer in Scheduler().timers)
@@ -0,0 +1,18 @@
+import pygame
+import pytest
+
+from game.paths import Paths
+from game.sounds import Sounds
+
+
+@pytest.mark.usefixtures("headless")
+def test_effects_play_on_reserved_channels() -> None:
+    sounds = Sounds()
+    assert sounds.sounds.keys() == sounds.channels.keys() == Sounds.EFFECTS.keys()
+
+    sounds.play("pick_up")
+    assert sounds.channels["pick_up"].get_sound() is sounds.sounds["pick_up"]
+    # Other sounds never take reserved channels.
+    channel = pygame.mixer.Sound(Paths.effects() / "1.ogg").play()
+    assert channel is not None
+    assert channel.id not in {reserved.id for reserved in sounds.channels.values()}
@@ -0,0 +1,49 @@
+import pytest
+from pygame.rect import FRect, Rect
+from pygame.sprite import Group, Sprite
+
+from game.spatial_hash import SpatialHash
+
+
+def make_sprite(group: Group, rect: Rect | FRect) -> Sprite:
+    sprite = Sprite(group)
+    sprite.rect = rect
+    return sprite
+
+
+@pytest.fixture
+def group() -> Group:
+    return Group()
+
+
+def test_collide_returns_sprite_spanning_cells_once(group: Group) -> None:
+    sprite = make_sprite(group, Rect(90, 90, 60, 60))
+    grid = SpatialHash(cell_size=100)
+    grid.rebuild(group)
+    assert grid.collide(Rect(80, 80, 100, 100)) == [sprite]
+
+
+def test_collide_skips_distant_and_killed_sprites(group: Group) -> None:
+    near = make_sprite(group, Rect(10, 10, 20, 20))
+    killed = make_sprite(group, Rect(15, 15, 20, 20))
+    make_sprite(group, Rect(500, 500, 20, 20))
+    grid = SpatialHash(cell_size=100)
+    grid.rebuild(group)
+    killed.kill()
+    assert grid.collide(Rect(0, 0, 50, 50)) == [near]
+    assert grid.collideany(Rect(400, 400, 50, 50)) is None
+
+
+def test_collide_handles_negative_coordinates(group: Group) -> None:
+    sprite = make_sprite(group, Rect(-30, -30, 20, 20))
+    grid = SpatialHash(cell_size=100)
+    grid.rebuild(group)
+    assert grid.collideany(Rect(-25, -25, 5, 5)) is sprite
+
+
+def test_collide_handles_fractional_rects(group: Group) -> None:
+    sprite = make_sprite(group, FRect(99.5, 10.25, 20, 20))
+    grid = SpatialHash(cell_size=100)
+    grid.rebuild(group)
+    assert grid.collide(FRect(95, 0.5, 4.5, 15)) == []
+    assert grid.collideany(FRect(95, 0.5, 4.75, 15)) is sprite
@@ -0,0 +1,17 @@
+from game import rng
+from game.spawn import SpawnRange
+
+
+def test_spawn_range_excludes_banned_ranges() -> None:
+    spawn = SpawnRange(0, 20, range(15, 30), range(3, 6), range(4, 8))
+    assert spawn.intervals == [range(3), range(8, 15)]
+    assert len(spawn) == 10
+
+
+def test_spawn_range_choice_matches_choice_from_list() -> None:
+    spawn = SpawnRange(60, 742, range(200, 606))
+    allowed = [y for y in range(60, 742) if y not in range(200, 606)]
+    rng.seed(1)
+    expected = [rng.choice(allowed) for _ in range(50)]
+    rng.seed(1)
+    assert [spawn.choice() for _ in range(50)] == expected